@@ -64,7 +64,7 @@ class EvidenceSynthesizer(BaseAgent):
             response_model=EvidencePack,
         )
 
-        # Add source snippets to the evidence pack
-        output.sources = source_snippets
+        # Add source snippets to the evidence pack (frozen, so copy)
+        output = output.model_copy(update={"sources": source_snippets})
 
         return output, metrics
@@ -129,12 +129,10 @@ class RigorFinder(BaseAgent):
             system=system,
             user=user,
             response_model=list[Finding],
+            chunk_index=chunk.chunk_index,
+            chunk_total=chunk.chunk_total,
         )
 
-        # Update metrics with chunk info
-        metrics.chunk_index = chunk.chunk_index
-        metrics.chunk_total = chunk.chunk_total
-
         logger.debug(
             f"[rigor_find] Section {chunk.chunk_index}/{chunk.chunk_total}: "
             f"{len(findings)} findings, {metrics.time_ms:.0f}ms"
@@ -9,6 +9,9 @@ from app.models import (
 )
 from app.composer.library import PromptLibrary
 
+_NO_BRIEFING = "(No briefing context available)"
+_NO_FINDINGS = "No findings."
+
 
 class Composer:
     """Builds prompts from template library."""
@@ -23,7 +26,7 @@ class Composer:
 
     def _format_findings(self, findings: list[Finding]) -> str:
         if not findings:
-            return "No findings."
+            return _NO_FINDINGS
         parts = []
         for f in findings:
             parts.append(f"[{f.severity.upper()}] {f.title}")
@@ -43,7 +46,8 @@ class Composer:
     ) -> tuple[str, str]:
         return (
             self.lib.BRIEFING_SYSTEM,
-            self.lib.BRIEFING_USER.format(
+            self.lib.render(
+                "BRIEFING_USER",
                 document_text=doc.get_text_for_briefing(),
                 steering_memo=self._steering(steering)
             )
@@ -53,45 +57,65 @@ class Composer:
     # CLARITY (CHUNKED)
     # -------------------------------------------------------------------------
 
+    def build_clarity_prefix(self, briefing: BriefingOutput | None) -> str:
+        """Chunk-independent head of the clarity user prompt (cacheable per document)."""
+        briefing_context = briefing.format_for_prompt() if briefing else _NO_BRIEFING
+        return self.lib.render("CLARITY_PREFIX", briefing_context=briefing_context)
+
+    def build_clarity_suffix(
+        self, chunk: ClarityChunk, steering: str | None = None
+    ) -> str:
+        """Per-chunk tail of the clarity user prompt."""
+        return self.lib.render(
+            "CLARITY_USER",
+            chunk_index=chunk.chunk_index + 1,
+            chunk_total=chunk.chunk_total,
+            chunk_text=chunk.get_text_with_ids(),
+            steering_memo=self._steering(steering)
+        )
+
     def build_clarity_prompt(
         self,
         chunk: ClarityChunk,
         briefing: BriefingOutput | None,
         steering: str | None = None
     ) -> tuple[str, str]:
-        briefing_context = briefing.format_for_prompt() if briefing else "(No briefing context available)"
         return (
             self.lib.CLARITY_SYSTEM,
-            self.lib.CLARITY_USER.format(
-                briefing_context=briefing_context,
-                chunk_index=chunk.chunk_index + 1,
-                chunk_total=chunk.chunk_total,
-                chunk_text=chunk.get_text_with_ids(),
-                steering_memo=self._steering(steering)
-            )
+            self.build_clarity_prefix(briefing) + self.build_clarity_suffix(chunk, steering)
         )
 
     # -------------------------------------------------------------------------
     # RIGOR (2-PHASE)
     # -------------------------------------------------------------------------
 
+    def build_rigor_find_prefix(self, briefing: BriefingOutput | None) -> str:
+        """Chunk-independent head of the rigor-find user prompt (cacheable per document)."""
+        briefing_context = briefing.format_for_prompt() if briefing else _NO_BRIEFING
+        return self.lib.render("RIGOR_FIND_PREFIX", briefing_context=briefing_context)
+
+    def build_rigor_find_suffix(
+        self, chunk: RigorChunk, steering: str | None = None
+    ) -> str:
+        """Per-chunk tail of the rigor-find user prompt."""
+        return self.lib.render(
+            "RIGOR_FIND_USER",
+            section_name=chunk.section.section_title or "Untitled",
+            chunk_index=chunk.chunk_index + 1,
+            chunk_total=chunk.chunk_total,
+            chunk_text=chunk.get_text_with_ids(),
+            steering_memo=self._steering(steering)
+        )
+
     def build_rigor_find_prompt(
         self,
         chunk: RigorChunk,
         briefing: BriefingOutput | None,
         steering: str | None = None
     ) -> tuple[str, str]:
-        briefing_context = briefing.format_for_prompt() if briefing else "(No briefing context available)"
         return (
             self.lib.RIGOR_FIND_SYSTEM,
-            self.lib.RIGOR_FIND_USER.format(
-                briefing_context=briefing_context,
-                section_name=chunk.section.section_title or "Untitled",
-                chunk_index=chunk.chunk_index + 1,
-                chunk_total=chunk.chunk_total,
-                chunk_text=chunk.get_text_with_ids(),
-                steering_memo=self._steering(steering)
-            )
+            self.build_rigor_find_prefix(briefing) + self.build_rigor_find_suffix(chunk, steering)
         )
 
     def build_rigor_rewrite_prompt(
@@ -101,7 +125,8 @@ class Composer:
     ) -> tuple[str, str]:
         return (
             self.lib.RIGOR_REWRITE_SYSTEM,
-            self.lib.RIGOR_REWRITE_USER.format(
+            self.lib.render(
+                "RIGOR_REWRITE_USER",
                 rigor_findings=self._format_findings(findings),
                 document_text=doc.get_text_with_ids()
             )
@@ -114,7 +139,8 @@ class Composer:
     def build_domain_target_prompt(self, doc: DocObj) -> tuple[str, str]:
         return (
             self.lib.DOMAIN_TARGET_SYSTEM,
-            self.lib.DOMAIN_TARGET_USER.format(
+            self.lib.render(
+                "DOMAIN_TARGET_USER",
                 document_text=doc.get_text_for_briefing()
             )
         )
@@ -122,7 +148,8 @@ class Composer:
     def build_domain_query_prompt(self, targets: DomainTargets) -> tuple[str, str]:
         return (
             self.lib.DOMAIN_QUERY_SYSTEM,
-            self.lib.DOMAIN_QUERY_USER.format(
+            self.lib.render(
+                "DOMAIN_QUERY_USER",
                 targets_json=targets.model_dump_json(indent=2)
             )
         )
@@ -132,7 +159,8 @@ class Composer:
     ) -> tuple[str, str]:
         return (
             self.lib.DOMAIN_SYNTH_SYSTEM,
-            self.lib.DOMAIN_SYNTH_USER.format(
+            self.lib.render(
+                "DOMAIN_SYNTH_USER",
                 targets_json=targets.model_dump_json(indent=2),
                 search_results=json.dumps(search_results, indent=2)
             )
@@ -150,10 +178,11 @@ class Composer:
         evidence: EvidencePack,
         steering: str | None = None
     ) -> tuple[str, str]:
-        briefing_context = briefing.format_for_prompt() if briefing else "(No briefing context available)"
+        briefing_context = briefing.format_for_prompt() if briefing else _NO_BRIEFING
         return (
             self.lib.ADVERSARY_SYSTEM,
-            self.lib.ADVERSARY_USER.format(
+            self.lib.render(
+                "ADVERSARY_USER",
                 briefing_context=briefing_context,
                 rigor_findings=self._format_findings(rigor_findings),
                 evidence_pack=evidence.format_for_prompt(),
@@ -170,21 +199,18 @@ class Composer:
         self,
         findings_by_model: list[tuple[str, list[Finding]]]
     ) -> tuple[str, str]:
-        # findings_by_model: [(model_name, findings), ...]
-        parts = []
-        for i, (model, findings) in enumerate(findings_by_model, 1):
-            parts.append(f"<reviewer_{i} model=\"{model}\">")
-            parts.append(self._format_findings(findings))
-            parts.append(f"</reviewer_{i}>")
+        # findings_by_model: [(model_name, findings), ...]; slots beyond len stay blank
+        fields = {}
+        for i in range(3):
+            if i < len(findings_by_model):
+                model, findings = findings_by_model[i]
+                fields[f"model_{i + 1}"] = model
+                fields[f"findings_{i + 1}"] = self._format_findings(findings)
+            else:
+                fields[f"model_{i + 1}"] = ""
+                fields[f"findings_{i + 1}"] = ""
 
         return (
             self.lib.RECONCILE_SYSTEM,
-            self.lib.RECONCILE_USER.format(
-                model_1=findings_by_model[0][0] if len(findings_by_model) > 0 else "",
-                findings_1=self._format_findings(findings_by_model[0][1]) if len(findings_by_model) > 0 else "",
-                model_2=findings_by_model[1][0] if len(findings_by_model) > 1 else "",
-                findings_2=self._format_findings(findings_by_model[1][1]) if len(findings_by_model) > 1 else "",
-                model_3=findings_by_model[2][0] if len(findings_by_model) > 2 else "",
-                findings_3=self._format_findings(findings_by_model[2][1]) if len(findings_by_model) > 2 else "",
-            )
+            self.lib.render("RECONCILE_USER", **fields)
         )
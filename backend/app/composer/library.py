@@ -2,10 +2,59 @@
 Prompt Library - All templates in one place.
 """
 
+from functools import lru_cache
+from string import Formatter
+
+
+class CompiledTemplate:
+    """
+    str.format-style template split into (literal, field_name) segments once.
+    render() appends literals and field values to one list and joins once -
+    no re-parsing of the template and no intermediate concatenations.
+    Supports plain {name} fields only (no format specs or conversions).
+    """
+
+    __slots__ = ("segments",)
+
+    def __init__(self, template: str):
+        segments = []
+        for literal, name, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{name}!{conversion}:{spec}}}")
+            segments.append((literal, name))
+        self.segments: tuple[tuple[str, str | None], ...] = tuple(segments)
+
+    def render(self, **ctx) -> str:
+        parts = []
+        append = parts.append
+        for literal, name in self.segments:
+            append(literal)
+            if name is not None:
+                append(str(ctx[name]))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _compile_templates(cls: type) -> dict[str, CompiledTemplate]:
+    """Compile a library class's *_USER/*_PREFIX templates; shared by all its instances."""
+    return {
+        name: CompiledTemplate(getattr(cls, name))
+        for name in dir(cls)
+        if name.endswith(("_USER", "_PREFIX"))
+    }
+
 
 class PromptLibrary:
     """Central store for all prompt templates."""
 
+    def __init__(self):
+        # *_USER/*_PREFIX templates take per-call fields; compiled once per class, not per Composer
+        self._compiled = _compile_templates(type(self))
+
+    def render(self, name: str, **ctx) -> str:
+        """Fill the named template, e.g. render("BRIEFING_USER", ...)."""
+        return self._compiled[name].render(**ctx)
+
     # =========================================================================
     # BRIEFING AGENT
     # =========================================================================
@@ -71,13 +120,17 @@ Rules:
 - Never guess author intent or invent content
 - IGNORE text marked [CONTEXT ONLY]"""
 
-    CLARITY_USER = """Review this document chunk for clarity issues.
+    # User prompt = CLARITY_PREFIX + CLARITY_USER. The prefix depends only on the
+    # briefing, so it is byte-identical across every chunk of a document.
+    CLARITY_PREFIX = """Review this document chunk for clarity issues.
 
 <briefing>
 {briefing_context}
 </briefing>
 
-<chunk info="{chunk_index} of {chunk_total}">
+"""
+
+    CLARITY_USER = """<chunk info="{chunk_index} of {chunk_total}">
 {chunk_text}
 </chunk>
 
@@ -143,13 +196,16 @@ Quality target: 3-5 substantive issues per section. Depth over breadth.
 
 Your job is to FIND issues. A separate agent will generate rewrites."""
 
-    RIGOR_FIND_USER = """Review this section for methodological and logical rigor.
+    # User prompt = RIGOR_FIND_PREFIX + RIGOR_FIND_USER (chunk-independent prefix)
+    RIGOR_FIND_PREFIX = """Review this section for methodological and logical rigor.
 
 <briefing>
 {briefing_context}
 </briefing>
 
-<section name="{section_name}" chunk="{chunk_index} of {chunk_total}">
+"""
+
+    RIGOR_FIND_USER = """<section name="{section_name}" chunk="{chunk_index} of {chunk_total}">
 {chunk_text}
 </section>
 
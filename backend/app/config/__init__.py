@@ -3,7 +3,7 @@
 from functools import lru_cache
 from .settings import Settings
 from .models import (
-    MODEL_COSTS, AGENT_MODELS,
+    MODEL_COSTS, AGENT_MODELS, REQUIRED_AGENTS,
     get_model, get_cost, calculate_cost, get_panel_models,
     ModelCost,
 )
@@ -18,6 +18,6 @@ def get_settings() -> Settings:
 __all__ = [
     "Settings",
     "get_settings",
-    "MODEL_COSTS", "AGENT_MODELS", "ModelCost",
+    "MODEL_COSTS", "AGENT_MODELS", "REQUIRED_AGENTS", "ModelCost",
     "get_model", "get_cost", "calculate_cost", "get_panel_models",
 ]
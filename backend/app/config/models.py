@@ -3,11 +3,18 @@ Central model registry and cost tracking.
 ALL agent-to-model mappings live here. Single source of truth.
 """
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 from pydantic import BaseModel
 
 
 class ModelCost(BaseModel):
-    """Cost per 1M tokens in USD."""
+    """Cost per 1M tokens in USD. Frozen; registry entries are shared."""
+
+    model_config = {"frozen": True}
+
     input: float
     output: float
 
@@ -16,7 +23,7 @@ class ModelCost(BaseModel):
 # MODEL COST REGISTRY
 # ============================================================
 
-MODEL_COSTS: dict[str, ModelCost] = {
+MODEL_COSTS: Mapping[str, ModelCost] = MappingProxyType({
     # Anthropic
     "claude-opus-4-20250514": ModelCost(input=15.0, output=75.0),
     "claude-sonnet-4-20250514": ModelCost(input=3.0, output=15.0),
@@ -31,14 +38,14 @@ MODEL_COSTS: dict[str, ModelCost] = {
     # Perplexity
     "sonar": ModelCost(input=1.0, output=1.0),
     "sonar-pro": ModelCost(input=3.0, output=15.0),
-}
+})
 
 
 # ============================================================
 # AGENT TO MODEL MAPPING
 # ============================================================
 
-AGENT_MODELS: dict[str, str] = {
+AGENT_MODELS: Mapping[str, str] = MappingProxyType({
     # Briefing
     "briefing": "claude-haiku-4-5-20251001",
 
@@ -65,35 +72,75 @@ AGENT_MODELS: dict[str, str] = {
 
     # Panel reconciliation
     "adversary_reconcile": "claude-haiku-4-5-20251001",
-}
+})
+
+# Every agent the pipeline calls must be mapped, and every mapped model priced.
+# Checked once at import so a missing entry fails at startup, not mid-review.
+REQUIRED_AGENTS: frozenset[str] = frozenset({
+    "briefing",
+    "clarity",
+    "rigor_find",
+    "rigor_rewrite",
+    "domain_target_extractor",
+    "domain_query_generator",
+    "domain_search",
+    "domain_evidence_synthesizer",
+    "adversary",
+    "adversary_panel_claude",
+    "adversary_panel_openai",
+    "adversary_panel_google",
+    "adversary_reconcile",
+})
+
+_missing_agents = REQUIRED_AGENTS - AGENT_MODELS.keys()
+if _missing_agents:
+    raise ValueError(f"AGENT_MODELS is missing agents: {sorted(_missing_agents)}")
+_unpriced_models = set(AGENT_MODELS.values()) - MODEL_COSTS.keys()
+if _unpriced_models:
+    raise ValueError(f"MODEL_COSTS is missing models: {sorted(_unpriced_models)}")
+
+# Panel mode reviewers, in fan-out order
+_PANEL: tuple[tuple[str, str], ...] = tuple(
+    (agent_id, AGENT_MODELS[agent_id])
+    for agent_id in (
+        "adversary_panel_claude",
+        "adversary_panel_openai",
+        "adversary_panel_google",
+    )
+)
 
 
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
+@lru_cache(maxsize=64)
 def get_model(agent_id: str) -> str:
-    """Get model name for an agent."""
+    """Get model name for an agent. Cached; AGENT_MODELS is read-only."""
     return AGENT_MODELS.get(agent_id, "claude-haiku-4-5-20251001")
 
 
+_DEFAULT_COST = ModelCost(input=3.0, output=15.0)
+
+# (input, output) USD per token, pre-divided so calculate_cost is two multiplies
+_RATES: dict[str, tuple[float, float]] = {
+    model: (cost.input / 1_000_000, cost.output / 1_000_000)
+    for model, cost in MODEL_COSTS.items()
+}
+_DEFAULT_RATE = (_DEFAULT_COST.input / 1_000_000, _DEFAULT_COST.output / 1_000_000)
+
+
 def get_cost(model: str) -> ModelCost:
     """Get cost structure for a model."""
-    return MODEL_COSTS.get(model, ModelCost(input=3.0, output=15.0))
+    return MODEL_COSTS.get(model, _DEFAULT_COST)
 
 
 def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     """Calculate USD cost for a call."""
-    cost = get_cost(model)
-    input_cost = (input_tokens / 1_000_000) * cost.input
-    output_cost = (output_tokens / 1_000_000) * cost.output
-    return input_cost + output_cost
+    input_rate, output_rate = _RATES.get(model, _DEFAULT_RATE)
+    return input_tokens * input_rate + output_tokens * output_rate
 
 
-def get_panel_models() -> list[tuple[str, str]]:
+def get_panel_models() -> tuple[tuple[str, str], ...]:
     """Get (agent_id, model) pairs for panel mode."""
-    return [
-        ("adversary_panel_claude", AGENT_MODELS["adversary_panel_claude"]),
-        ("adversary_panel_openai", AGENT_MODELS["adversary_panel_openai"]),
-        ("adversary_panel_google", AGENT_MODELS["adversary_panel_google"]),
-    ]
+    return _PANEL
@@ -14,7 +14,7 @@ from .domain import (
     SearchResult, SearchExecutorOutput, SourceSnippet, EvidencePack, DomainOutput
 )
 from .chunks import ClarityChunk, RigorChunk, ContextOverlap
-from .metrics import AgentMetrics, ReviewMetrics
+from .metrics import AgentMetrics, ReviewMetrics, AgentUsage, DevBanner, DevBannerTotal
 from .review import (
     ReviewConfig, ReviewJob,
     ReviewSummary, ReviewMetadataOutput, ReviewOutput
@@ -40,7 +40,7 @@ __all__ = [
     # Chunks
     "ClarityChunk", "RigorChunk", "ContextOverlap",
     # Metrics
-    "AgentMetrics", "ReviewMetrics",
+    "AgentMetrics", "ReviewMetrics", "AgentUsage", "DevBanner", "DevBannerTotal",
     # Review
     "ReviewConfig", "ReviewJob",
     "ReviewSummary", "ReviewMetadataOutput", "ReviewOutput",
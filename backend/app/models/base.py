@@ -0,0 +1,29 @@
+"""Shared model behaviour."""
+
+from functools import cached_property, lru_cache
+
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of every functools.cached_property on cls and its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class CachedPropertyMixin:
+    """
+    For frozen models that memoize derived values with cached_property.
+
+    model_copy shares the source's __dict__ contents, cached values included;
+    drop them so the copy rebuilds its own from the (possibly updated) fields.
+    """
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _cached_property_names(type(self)):
+            copied.__dict__.pop(name, None)
+        return copied
@@ -1,10 +1,16 @@
 """Briefing agent output model."""
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
+from app.models.base import CachedPropertyMixin
+
+
+class BriefingOutput(CachedPropertyMixin, BaseModel):
+    """Context extracted by Briefing agent. Immutable; shared read-only by downstream agents."""
 
-class BriefingOutput(BaseModel):
-    """Context extracted by Briefing agent."""
+    model_config = {"frozen": True}
 
     summary: str = Field(max_length=500)
     main_claims: list[str] = Field(min_length=1, max_length=10)
@@ -13,7 +19,9 @@ class BriefingOutput(BaseModel):
     methodology_summary: str | None = None
     domain_keywords: list[str] = Field(default_factory=list, max_length=20)
 
-    def format_for_prompt(self) -> str:
+    @cached_property
+    def formatted_prompt(self) -> str:
+        """Prompt rendering, built once per instance (the model is frozen)."""
         parts = [
             f"Summary: {self.summary}",
             f"Main claims: {'; '.join(self.main_claims)}",
@@ -25,3 +33,6 @@ class BriefingOutput(BaseModel):
         if self.methodology_summary:
             parts.append(f"Methodology: {self.methodology_summary}")
         return "\n".join(parts)
+
+    def format_for_prompt(self) -> str:
+        return self.formatted_prompt
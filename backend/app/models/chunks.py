@@ -5,7 +5,9 @@ from app.models.document import Paragraph, Section
 
 
 class ContextOverlap(BaseModel):
-    """3-sentence context from adjacent chunks."""
+    """3-sentence context from adjacent chunks. Immutable."""
+    model_config = {"frozen": True}
+
     sentences: list[str] = Field(default_factory=list, max_length=3)
     source: str = Field(description="'previous' or 'next'")
 
@@ -5,10 +5,16 @@ All agents reference this structure via paragraph_id, sentence_id.
 
 import re
 from datetime import datetime
-from typing import Literal
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Literal
 from pydantic import BaseModel, Field
 import uuid
 
+from app.models.base import CachedPropertyMixin
+
+if TYPE_CHECKING:
+    from app.models.finding import Anchor
+
 
 # Section patterns for filtering
 EXCLUDED_SECTIONS_PATTERN = re.compile(
@@ -103,11 +109,15 @@ class DocumentMetadata(BaseModel):
     modified_date: datetime | None = None
 
 
-class DocObj(BaseModel):
+class DocObj(CachedPropertyMixin, BaseModel):
     """
     Immutable document representation.
     All agents reference this structure.
+    Frozen, so derived lookups are computed once per instance.
     """
+
+    model_config = {"frozen": True}
+
     document_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     filename: str
     type: Literal["pdf", "docx"]
@@ -130,29 +140,47 @@ class DocObj(BaseModel):
     source_format: str | None = Field(None, exclude=True)
     meta: dict | None = Field(None, exclude=True)
 
+    @cached_property
+    def paragraphs_by_id(self) -> dict[str, Paragraph]:
+        """paragraph_id -> Paragraph; first occurrence wins, as with a linear scan."""
+        return {p.paragraph_id: p for p in reversed(self.paragraphs)}
+
     def get_paragraph(self, paragraph_id: str) -> Paragraph | None:
-        return next((p for p in self.paragraphs if p.paragraph_id == paragraph_id), None)
+        return self.paragraphs_by_id.get(paragraph_id)
 
     def get_paragraph_text(self, paragraph_id: str) -> str | None:
-        p = self.get_paragraph(paragraph_id)
-        return p.text if p else None
+        p = self.paragraphs_by_id.get(paragraph_id)
+        return p.text if p is not None else None
 
-    def get_full_text(self) -> str:
-        return "\n\n".join(p.text for p in self.paragraphs)
+    @cached_property
+    def full_text(self) -> str:
+        return "\n\n".join([p.text for p in self.paragraphs])
 
-    def get_text_for_briefing(self) -> str:
-        """Get document text excluding reference sections (for briefing/domain)."""
+    @cached_property
+    def text_for_briefing(self) -> str:
+        """Document text excluding reference sections (for briefing/domain)."""
         excluded_section_ids = {
             s.section_id for s in self.sections
             if s.section_title and EXCLUDED_SECTIONS_PATTERN.match(s.section_title)
         }
-        return "\n\n".join(
+        return "\n\n".join([
             p.text for p in self.paragraphs
             if p.section_id not in excluded_section_ids
-        )
+        ])
+
+    @cached_property
+    def text_with_ids(self) -> str:
+        return "\n\n".join([f"[{p.paragraph_id}] {p.text}" for p in self.paragraphs])
+
+    def get_full_text(self) -> str:
+        return self.full_text
+
+    def get_text_for_briefing(self) -> str:
+        """Get document text excluding reference sections (for briefing/domain)."""
+        return self.text_for_briefing
 
     def get_text_with_ids(self) -> str:
-        return "\n\n".join(f"[{p.paragraph_id}] {p.text}" for p in self.paragraphs)
+        return self.text_with_ids
 
     def get_section_paragraphs(self, section_id: str) -> list[Paragraph]:
         return [p for p in self.paragraphs if p.section_id == section_id]
@@ -179,5 +207,14 @@ class DocObj(BaseModel):
         return []
 
     def validate_anchor_text(self, paragraph_id: str, quoted_text: str) -> bool:
-        text = self.get_paragraph_text(paragraph_id)
-        return text is not None and quoted_text in text
+        p = self.paragraphs_by_id.get(paragraph_id)
+        return p is not None and quoted_text in p.text
+
+    def validate_anchor_texts(self, anchors: Iterable["Anchor"]) -> list[bool]:
+        """validate_anchor_text for each anchor, in order."""
+        by_id = self.paragraphs_by_id
+        results = []
+        for a in anchors:
+            p = by_id.get(a.paragraph_id)
+            results.append(p is not None and a.quoted_text in p.text)
+        return results
@@ -4,9 +4,13 @@ Domain Pipeline Models v1
 Domain provides AMMUNITION for Adversary - external evidence to strengthen critiques.
 """
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field, field_validator
 from typing import Literal
 
+from app.models.base import CachedPropertyMixin
+
 
 # ============================================================
 # STAGE 1: TARGET EXTRACTION
@@ -14,6 +18,9 @@ from typing import Literal
 
 class SearchPriority(BaseModel):
     """What to search for in literature."""
+
+    model_config = {"frozen": True}
+
     search_for: str = Field(description="Specific search target")
     why_it_matters: str = Field(description="How this affects evaluation")
     search_type: Literal[
@@ -28,7 +35,9 @@ class SearchPriority(BaseModel):
 
 
 class DomainTargets(BaseModel):
-    """Output from Stage 1: Target Extractor."""
+    """Output from Stage 1: Target Extractor. Immutable; read by query generation."""
+
+    model_config = {"frozen": True}
 
     document_type: str
 
@@ -101,15 +110,30 @@ class SearchExecutorOutput(BaseModel):
 # STAGE 4: EVIDENCE SYNTHESIS (FINAL OUTPUT)
 # ============================================================
 
-class EvidencePack(BaseModel):
+# (field, header) in prompt order; headers after the first carry their blank line
+_EVIDENCE_SECTIONS = (
+    ("design_limitations", "DESIGN LIMITATIONS (what this study CANNOT establish):"),
+    ("contradictions", "\nCONTRADICTIONS:"),
+    ("prior_work", "\nPRIOR WORK:"),
+    ("field_consensus", "\nFIELD CONSENSUS:"),
+    ("method_context", "\nMETHOD CONTEXT:"),
+    ("failed_attempts", "\nFAILED ATTEMPTS:"),
+)
+
+
+class EvidencePack(CachedPropertyMixin, BaseModel):
     """
     External evidence package for Adversary.
 
     This is SUPPLEMENTARY AMMUNITION, not primary guidance.
     Adversary reads the paper itself and forms critique.
     Evidence STRENGTHENS attacks with citations.
+
+    Immutable once built; use model_copy(update=...) to derive a variant.
     """
 
+    model_config = {"frozen": True}
+
     # Transparency: what we searched
     queries_used: list[str] = Field(default_factory=list)
     query_rationale: list[str] = Field(default_factory=list)
@@ -165,45 +189,24 @@ class EvidencePack(BaseModel):
             self.gaps
         )
 
-    def format_for_prompt(self) -> str:
-        """Format for Adversary prompt."""
+    @cached_property
+    def formatted_prompt(self) -> str:
+        """Format for Adversary prompt. Built once per instance (the model is frozen)."""
         parts = []
-
-        if self.design_limitations:
-            parts.append("DESIGN LIMITATIONS (what this study CANNOT establish):")
-            for item in self.design_limitations:
-                parts.append(f"  - {item}")
-
-        if self.contradictions:
-            parts.append("\nCONTRADICTIONS:")
-            for item in self.contradictions:
-                parts.append(f"  - {item}")
-
-        if self.prior_work:
-            parts.append("\nPRIOR WORK:")
-            for item in self.prior_work:
-                parts.append(f"  - {item}")
-
-        if self.field_consensus:
-            parts.append("\nFIELD CONSENSUS:")
-            for item in self.field_consensus:
-                parts.append(f"  - {item}")
-
-        if self.method_context:
-            parts.append("\nMETHOD CONTEXT:")
-            for item in self.method_context:
-                parts.append(f"  - {item}")
-
-        if self.failed_attempts:
-            parts.append("\nFAILED ATTEMPTS:")
-            for item in self.failed_attempts:
-                parts.append(f"  - {item}")
+        for field, header in _EVIDENCE_SECTIONS:
+            items = getattr(self, field)
+            if items:
+                parts.append(header)
+                parts.extend([f"  - {item}" for item in items])
 
         if self.gaps:
             parts.append(f"\nEVIDENCE GAPS: {self.gaps}")
 
         return "\n".join(parts) if parts else "No external evidence found."
 
+    def format_for_prompt(self) -> str:
+        return self.formatted_prompt
+
 
 class DomainOutput(BaseModel):
     """Complete Domain pipeline output."""
@@ -7,11 +7,17 @@ from pydantic import BaseModel, Field
 from app.models.finding import Finding
 
 
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
 class BaseEvent(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    def to_sse(self) -> str:
-        return f"data: {self.model_dump_json()}\n\n"
+    def to_sse(self) -> bytes:
+        # Serializer writes JSON bytes directly; StreamingResponse sends bytes as-is,
+        # so there is no str decode here and re-encode per chunk in Starlette
+        return _SSE_PREFIX + self.__pydantic_serializer__.to_json(self) + _SSE_SUFFIX
 
 
 class PhaseStartedEvent(BaseEvent):
@@ -76,7 +76,9 @@ AGENT_TO_TRACK: dict[str, Track] = {
 
 
 class Anchor(BaseModel):
-    """Precise location reference in document."""
+    """Precise location reference in document. Immutable."""
+    model_config = {"frozen": True}
+
     paragraph_id: str
     sentence_id: str | None = None
     quoted_text: str = Field(min_length=1)
@@ -84,13 +86,15 @@ class Anchor(BaseModel):
     @field_validator("quoted_text")
     @classmethod
     def not_empty(cls, v: str) -> str:
-        if not v.strip():
+        if not v or v.isspace():
             raise ValueError("quoted_text cannot be empty")
         return v
 
 
 class ProposedEdit(BaseModel):
-    """Suggested modification."""
+    """Suggested modification. Immutable; derive variants with model_copy."""
+    model_config = {"frozen": True}
+
     type: Literal["replace", "delete", "insert_before", "insert_after", "suggestion"]
     anchor: Anchor
     new_text: str | None = None
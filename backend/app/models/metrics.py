@@ -4,11 +4,15 @@ Every agent call produces AgentMetrics.
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import TypedDict
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class AgentMetrics(BaseModel):
-    """Metrics from a single agent call."""
+    """Metrics from a single agent call. Immutable once recorded."""
+
+    model_config = {"frozen": True}
+
     agent_id: str
     model: str
     input_tokens: int
@@ -20,41 +24,79 @@ class AgentMetrics(BaseModel):
     chunk_total: int | None = None
 
 
+class AgentUsage(TypedDict):
+    """Per-agent rollup in the dev banner."""
+    model: str
+    calls: int
+    time_ms: float
+    cost_usd: float
+    input_tokens: int
+    output_tokens: int
+
+
+class DevBannerTotal(TypedDict):
+    """Review-wide totals in the dev banner."""
+    time_s: float
+    cost_usd: float
+    tokens: int
+
+
+class DevBanner(TypedDict):
+    """Shape of ReviewMetrics.to_dev_banner() sent to the frontend."""
+    total: DevBannerTotal
+    agents: dict[str, AgentUsage]
+
+
 class ReviewMetrics(BaseModel):
-    """Aggregated metrics for dev banner."""
+    """
+    Aggregated metrics for dev banner.
+
+    Totals and the per-agent rollup are running sums kept current by add(),
+    so neither is ever recomputed from agent_metrics.
+    """
     agent_metrics: list[AgentMetrics] = Field(default_factory=list)
     total_time_ms: float = 0
     total_cost_usd: float = 0
     total_input_tokens: int = 0
     total_output_tokens: int = 0
 
+    _by_agent: dict[str, AgentUsage] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        # Seed the rollup when constructed/validated with existing agent_metrics
+        for m in self.agent_metrics:
+            self._tally(m)
+
     def add(self, metrics: AgentMetrics) -> None:
         self.agent_metrics.append(metrics)
         self.total_time_ms += metrics.time_ms
         self.total_cost_usd += metrics.cost_usd
         self.total_input_tokens += metrics.input_tokens
         self.total_output_tokens += metrics.output_tokens
+        self._tally(metrics)
 
-    def by_agent(self) -> dict[str, dict]:
-        result = {}
-        for m in self.agent_metrics:
-            if m.agent_id not in result:
-                result[m.agent_id] = {
-                    "model": m.model,
-                    "calls": 0,
-                    "time_ms": 0,
-                    "cost_usd": 0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                }
-            result[m.agent_id]["calls"] += 1
-            result[m.agent_id]["time_ms"] += m.time_ms
-            result[m.agent_id]["cost_usd"] += m.cost_usd
-            result[m.agent_id]["input_tokens"] += m.input_tokens
-            result[m.agent_id]["output_tokens"] += m.output_tokens
-        return result
-
-    def to_dev_banner(self) -> dict:
+    def _tally(self, metrics: AgentMetrics) -> None:
+        usage = self._by_agent.get(metrics.agent_id)
+        if usage is None:
+            usage = self._by_agent[metrics.agent_id] = {
+                "model": metrics.model,
+                "calls": 0,
+                "time_ms": 0,
+                "cost_usd": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+            }
+        usage["calls"] += 1
+        usage["time_ms"] += metrics.time_ms
+        usage["cost_usd"] += metrics.cost_usd
+        usage["input_tokens"] += metrics.input_tokens
+        usage["output_tokens"] += metrics.output_tokens
+
+    def by_agent(self) -> dict[str, AgentUsage]:
+        """Per-agent rollup, copied from the running totals kept by add()."""
+        return {agent_id: usage.copy() for agent_id, usage in self._by_agent.items()}
+
+    def to_dev_banner(self) -> DevBanner:
         """Format for frontend."""
         return {
             "total": {
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Literal, Any
-from pydantic import BaseModel, Field, model_serializer
+from pydantic import BaseModel, Field, TypeAdapter, model_serializer
 from collections import Counter
 import uuid
 
@@ -104,6 +104,11 @@ class ReviewMetadataOutput(BaseModel):
         }
 
 
+# Built once: dumps a whole findings list in one serializer call instead of
+# one model_dump() round-trip per finding
+_FINDINGS_ADAPTER = TypeAdapter(list[Finding])
+
+
 class ReviewOutput(BaseModel):
     """Complete review output for API response."""
     findings: list[Finding]
@@ -114,7 +119,7 @@ class ReviewOutput(BaseModel):
     @model_serializer
     def serialize(self) -> dict[str, Any]:
         return {
-            "findings": [f.model_dump() for f in self.findings],
+            "findings": _FINDINGS_ADAPTER.dump_python(self.findings),
             "summary": self.summary.model_dump(),
             "metadata": self.metadata.model_dump(),
             "narrative": self.narrative,
@@ -129,7 +129,9 @@ class Assembler:
                                 f"quoted_text not found → keeping as comment-only"
                             )
                             # Convert to suggestion type since we can't do replace
-                            f.proposed_edit.type = "suggestion"
+                            f.proposed_edit = f.proposed_edit.model_copy(
+                                update={"type": "suggestion"}
+                            )
                         else:
                             issues.append(f"quoted_text not found (requires exact match for replace)")
                             is_valid = False
@@ -104,6 +104,7 @@ def chunk_for_clarity(
                 all_paragraphs=filtered_paras,
                 chunk_index=len(chunks),
                 n_context=n_context,
+                word_count=current_words,
             ))
             current_paras = []
             current_words = 0
@@ -118,6 +119,7 @@ def chunk_for_clarity(
             all_paragraphs=filtered_paras,
             chunk_index=len(chunks),
             n_context=n_context,
+            word_count=current_words,
         ))
 
     # Set total count
@@ -135,8 +137,12 @@ def _build_clarity_chunk(
     all_paragraphs: list[Paragraph],
     chunk_index: int,
     n_context: int,
+    word_count: int | None = None,
 ) -> ClarityChunk:
-    """Build a ClarityChunk with context overlap."""
+    """
+    Build a ClarityChunk with context overlap.
+    word_count: total words in paragraphs, if the caller already counted them.
+    """
     first_idx = all_paragraphs.index(paragraphs[0])
     last_idx = all_paragraphs.index(paragraphs[-1])
 
@@ -151,7 +157,7 @@ def _build_clarity_chunk(
         chunk_total=0,  # Set later
         paragraphs=paragraphs,
         paragraph_ids=[p.paragraph_id for p in paragraphs],
-        word_count=sum(len(p.text.split()) for p in paragraphs),
+        word_count=word_count if word_count is not None else sum(len(p.text.split()) for p in paragraphs),
         context_before=context_before,
         context_after=context_after,
     )
@@ -20,6 +20,7 @@ Logs to terminal with timing and cost information.
 import asyncio
 import logging
 import time
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
 from app.models import (
@@ -38,8 +39,9 @@ from app.agents.adversary import AdversaryAgent
 from app.agents.domain import DomainPipeline
 from app.services.assembler import Assembler
 from app.core import get_llm_client
+from app.core.llm import LLMClient
 from app.composer import Composer
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 
 # Terminal logging setup
@@ -96,6 +98,44 @@ def _log_summary(elapsed: float, cost: float, findings: int, raw_count: int):
                 (f" (dedupe removed {removed})" if removed else ""))
 
 
+@dataclass
+class OrchestratorAgents:
+    """
+    Agent instances the orchestrator runs.
+
+    Agents hold no per-review state, so one set is shared across runs.
+    Tests pass their own instances instead of patching module names.
+    """
+    briefing: BriefingAgent
+    domain: DomainPipeline
+    clarity: ClarityAgent
+    rigor_find: RigorFinder
+    rigor_rewrite: RigorRewriter
+    adversary: AdversaryAgent
+    adversary_panel: AdversaryAgent
+    assembler: Assembler
+
+    @classmethod
+    def default(
+        cls,
+        client: LLMClient | None = None,
+        composer: Composer | None = None
+    ) -> "OrchestratorAgents":
+        """Build the real agents sharing one LLM client and composer."""
+        client = client or get_llm_client()
+        composer = composer or Composer()
+        return cls(
+            briefing=BriefingAgent(client=client, composer=composer),
+            domain=DomainPipeline(client=client, composer=composer),
+            clarity=ClarityAgent(client=client, composer=composer),
+            rigor_find=RigorFinder(client=client, composer=composer),
+            rigor_rewrite=RigorRewriter(client=client, composer=composer),
+            adversary=AdversaryAgent(panel_mode=False, client=client, composer=composer),
+            adversary_panel=AdversaryAgent(panel_mode=True, client=client, composer=composer),
+            assembler=Assembler(),
+        )
+
+
 class Orchestrator:
     """
     Pipeline orchestrator with dependency-based parallel execution.
@@ -104,9 +144,14 @@ class Orchestrator:
     not waiting for unrelated agents to complete.
     """
 
-    def __init__(self):
-        self._client = get_llm_client()
-        self._composer = Composer()
+    def __init__(
+        self,
+        agents: OrchestratorAgents | None = None,
+        settings: Settings | None = None
+    ):
+        self.agents = agents or OrchestratorAgents.default()
+        # None reads the app settings at run time, as before
+        self.settings = settings
 
     async def run(
         self,
@@ -168,11 +213,7 @@ class Orchestrator:
             ))
 
             try:
-                briefing_agent = BriefingAgent(
-                    client=self._client,
-                    composer=self._composer
-                )
-                briefing_result, agent_metrics = await briefing_agent.run(
+                briefing_result, agent_metrics = await self.agents.briefing.run(
                     doc,
                     steering=config.steering_memo
                 )
@@ -210,11 +251,7 @@ class Orchestrator:
             ))
 
             try:
-                domain_pipeline = DomainPipeline(
-                    client=self._client,
-                    composer=self._composer
-                )
-                evidence_result, domain_metrics = await domain_pipeline.run(doc)
+                evidence_result, domain_metrics = await self.agents.domain.run(doc)
                 await add_metrics(domain_metrics)
 
                 elapsed = time.time() - agent_start
@@ -239,10 +276,7 @@ class Orchestrator:
             await briefing_ready.wait()
 
             agent_start = time.time()
-            clarity_agent = ClarityAgent(
-                client=self._client,
-                composer=self._composer
-            )
+            clarity_agent = self.agents.clarity
 
             # Get chunk count for logging
             chunks = clarity_agent.get_chunks(doc)
@@ -319,10 +353,7 @@ class Orchestrator:
             await briefing_ready.wait()
 
             agent_start = time.time()
-            rigor_finder = RigorFinder(
-                client=self._client,
-                composer=self._composer
-            )
+            rigor_finder = self.agents.rigor_find
 
             # Get section count for logging
             sections = rigor_finder.get_sections(doc)
@@ -402,10 +433,7 @@ class Orchestrator:
                 return
 
             agent_start = time.time()
-            rigor_rewriter = RigorRewriter(
-                client=self._client,
-                composer=self._composer
-            )
+            rigor_rewriter = self.agents.rigor_rewrite
 
             # Get batch count for logging
             batches = rigor_rewriter._group_by_section(rigor_findings_result, doc)
@@ -504,10 +532,9 @@ class Orchestrator:
             ))
 
             try:
-                adversary_agent = AdversaryAgent(
-                    panel_mode=config.panel_mode,
-                    client=self._client,
-                    composer=self._composer
+                adversary_agent = (
+                    self.agents.adversary_panel if config.panel_mode
+                    else self.agents.adversary
                 )
                 adversary_findings, adversary_metrics = await adversary_agent.run(
                     doc,
@@ -542,7 +569,7 @@ class Orchestrator:
         # ============================================================
         # LAUNCH ALL TASKS (respecting agent toggles from settings)
         # ============================================================
-        settings = get_settings()
+        settings = self.settings or get_settings()
 
         # Helper to create a skip task that just signals ready
         async def skip_agent(name: str, ready_event: asyncio.Event | None = None):
@@ -602,8 +629,7 @@ class Orchestrator:
                 subtitle=f"Processing {len(all_findings)} raw findings"
             ))
 
-            assembler = Assembler()
-            review_output = assembler.assemble(all_findings, all_metrics, doc=doc)
+            review_output = self.agents.assembler.assemble(all_findings, all_metrics, doc=doc)
 
             elapsed = time.time() - agent_start
             removed = len(all_findings) - len(review_output.findings)
@@ -650,7 +676,6 @@ class Orchestrator:
                     "agent_metrics": agent_metrics_agg,
                     "by_track": review_output.summary.by_track,
                     "by_severity": review_output.summary.by_severity,
-                    "by_dimension": review_output.summary.by_dimension,
                 }
             ))
             await event_queue.put(None)  # Signal end
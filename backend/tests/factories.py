@@ -0,0 +1,16 @@
+"""
+Shared builders for hand-written test data.
+"""
+
+from app.models import Finding, AGENT_TO_TRACK
+
+
+def mk_finding(**kwargs) -> Finding:
+    """
+    Build a Finding from trusted test data without running validation.
+
+    model_construct skips validators, so track is derived here the same way
+    Finding.auto_derive_fields would. Only safe for hand-written fixtures.
+    """
+    kwargs.setdefault("track", AGENT_TO_TRACK.get(kwargs["agent_id"], "A"))
+    return Finding.model_construct(**kwargs)
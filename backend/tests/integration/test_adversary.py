@@ -3,6 +3,8 @@ Tests for adversary agents.
 TDD Phase 11: Adversary Agent (Single + Panel + Reconcile)
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -84,7 +86,7 @@ def mock_finding() -> Finding:
     return Finding(
         id="adv_001",
         agent_id="adversary",
-        category="adversarial_weakness",
+        category="overclaim",
         severity="critical",
         title="Critical flaw in methodology",
         description="The statistical approach is flawed.",
@@ -169,7 +171,7 @@ class TestSingleAdversary:
         critical_finding = Finding(
             id="adv_001",
             agent_id="adversary",
-            category="adversarial_weakness",
+            category="overclaim",
             severity="critical",
             title="Critical issue",
             description="A critical problem.",
@@ -178,7 +180,7 @@ class TestSingleAdversary:
         major_finding = Finding(
             id="adv_002",
             agent_id="adversary",
-            category="adversarial_gap",
+            category="assumption",
             severity="major",
             title="Major gap",
             description="A major gap.",
@@ -234,6 +236,40 @@ class TestPanelAdversary:
             # Should have called 3 times (one per model)
             assert mock_client.call.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_panel_dispatch_parallel(
+        self, sample_doc, sample_briefing, sample_evidence, mock_finding, mock_metrics
+    ):
+        """All 3 panel calls are in flight at once, sharing one built prompt."""
+        agent = PanelAdversary()
+        in_flight = 0
+        all_started = asyncio.Event()
+
+        async def fake_call(**kwargs):
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 3:
+                all_started.set()
+            # Serial dispatch would never reach 3 in flight and time out here
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return [mock_finding], mock_metrics
+
+        with patch.object(agent, 'client') as mock_client, \
+                patch.object(
+                    agent.composer, 'build_adversary_prompt',
+                    wraps=agent.composer.build_adversary_prompt
+                ) as build:
+            mock_client.call = AsyncMock(side_effect=fake_call)
+
+            _, metrics = await agent.run(
+                sample_doc, sample_briefing, [], sample_evidence
+            )
+
+        assert len(metrics) == 3
+        assert build.call_count == 1
+        prompts = {c.kwargs["user"] for c in mock_client.call.call_args_list}
+        assert len(prompts) == 1
+
     @pytest.mark.asyncio
     async def test_returns_findings_from_all_models(
         self, sample_doc, sample_briefing, sample_evidence, mock_metrics
@@ -241,19 +277,19 @@ class TestPanelAdversary:
         """Should return findings from all 3 models."""
         finding1 = Finding(
             id="f1", agent_id="adversary_panel_claude",
-            category="adversarial_weakness", severity="critical",
+            category="overclaim", severity="critical",
             title="Issue 1", description="Desc",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="results")],
         )
         finding2 = Finding(
             id="f2", agent_id="adversary_panel_openai",
-            category="adversarial_gap", severity="major",
+            category="assumption", severity="major",
             title="Issue 2", description="Desc",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="results")],
         )
         finding3 = Finding(
             id="f3", agent_id="adversary_panel_google",
-            category="adversarial_alternative", severity="major",
+            category="alternative", severity="major",
             title="Issue 3", description="Desc",
             anchors=[Anchor(paragraph_id="p_002", quoted_text="methodology")],
         )
@@ -301,13 +337,13 @@ class TestReconciler:
         # Two findings about the same issue
         finding1 = Finding(
             id="f1", agent_id="adversary_panel_claude",
-            category="adversarial_weakness", severity="critical",
+            category="overclaim", severity="critical",
             title="Statistical flaw", description="Stats are wrong",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="statistical analysis")],
         )
         finding2 = Finding(
             id="f2", agent_id="adversary_panel_openai",
-            category="adversarial_weakness", severity="critical",
+            category="overclaim", severity="critical",
             title="Statistics issue", description="Statistical problems",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="statistical analysis")],
         )
@@ -323,7 +359,7 @@ class TestReconciler:
         # Mock returns merged finding with votes
         merged_finding = Finding(
             id="merged_1", agent_id="adversary_panel",
-            category="adversarial_weakness", severity="critical",
+            category="overclaim", severity="critical",
             title="Statistical flaw", description="Stats are wrong",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="statistical analysis")],
             votes=2,
@@ -341,7 +377,7 @@ class TestReconciler:
         """Reconciler should set votes field (1, 2, or 3)."""
         finding_voted = Finding(
             id="f1", agent_id="adversary_panel",
-            category="adversarial_weakness", severity="critical",
+            category="overclaim", severity="critical",
             title="Issue", description="Desc",
             anchors=[Anchor(paragraph_id="p_001", quoted_text="text")],
             votes=3,
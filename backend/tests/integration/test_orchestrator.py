@@ -5,21 +5,67 @@ Tests:
 - Runs Briefing and Domain in parallel
 - Runs Clarity and Rigor-Find after Briefing
 - Runs Rigor-Rewrite and Adversary in parallel
+- Picks the single or panel adversary from config.panel_mode
 - Runs Assembler at end
-- Returns ReviewJob with findings and metrics
-- Metrics aggregated for dev banner
+- Final ReviewCompletedEvent carries findings and aggregated metrics
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
-from app.services.orchestrator import Orchestrator
+from app.config import Settings
+from app.services.assembler import Assembler
+from app.services.orchestrator import Orchestrator, OrchestratorAgents
 from app.models import (
     DocObj, Paragraph, Section, Sentence,
-    ReviewConfig, ReviewJob,
-    BriefingOutput, EvidencePack, Finding, Anchor,
-    AgentMetrics, ReviewMetrics,
+    ReviewConfig,
+    BriefingOutput, EvidencePack, Anchor, AgentMetrics,
+    ReviewCompletedEvent, ErrorEvent,
+)
+from tests.factories import mk_finding
+
+
+# ============================================================
+# SHARED FINDINGS
+# ============================================================
+RIGOR_FINDING = mk_finding(
+    id="rigor-001",
+    agent_id="rigor_find",
+    category="rigor_methodology",
+    severity="major",
+    title="Rigor issue",
+    description="Method concern",
+    anchors=[Anchor.model_construct(paragraph_id="p_002", quoted_text="Methods")],
+)
+
+REWRITTEN_RIGOR_FINDING = mk_finding(
+    id="rigor-001",
+    agent_id="rigor_rewrite",
+    category="rigor_methodology",
+    severity="major",
+    title="Rigor issue",
+    description="Description",
+    anchors=[Anchor.model_construct(paragraph_id="p_002", quoted_text="text")],
+)
+
+CLARITY_FINDING = mk_finding(
+    id="clarity-001",
+    agent_id="clarity",
+    category="clarity_sentence",
+    severity="minor",
+    title="Clarity issue",
+    description="Description",
+    anchors=[Anchor.model_construct(paragraph_id="p_001", quoted_text="text")],
+)
+
+ADVERSARY_FINDING = mk_finding(
+    id="adversary-001",
+    agent_id="adversary",
+    category="overclaim",
+    severity="critical",
+    title="Adversary issue",
+    description="Description",
+    anchors=[Anchor.model_construct(paragraph_id="p_001", quoted_text="text")],
 )
 
 
@@ -27,9 +73,9 @@ from app.models import (
 # FIXTURES
 # ============================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_doc():
-    """Sample document for testing."""
+    """Sample document for testing (read-only, built once per module)."""
     return DocObj(
         document_id="test-doc-001",
         filename="test.pdf",
@@ -87,9 +133,9 @@ def sample_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_briefing():
-    """Sample briefing output."""
+    """Sample briefing output (read-only, built once per module)."""
     return BriefingOutput(
         summary="Test document about methods",
         main_claims=["Claim 1", "Claim 2"],
@@ -111,14 +157,14 @@ def sample_evidence():
 @pytest.fixture
 def sample_finding():
     """Sample finding."""
-    return Finding(
+    return mk_finding(
         id="finding-001",
         agent_id="clarity",
         category="clarity_sentence",
         severity="minor",
         title="Test finding",
         description="Test description",
-        anchors=[Anchor(paragraph_id="p_001", quoted_text="introduction")],
+        anchors=[Anchor.model_construct(paragraph_id="p_001", quoted_text="introduction")],
     )
 
 
@@ -135,6 +181,76 @@ def sample_metrics():
     )
 
 
+def _stream_of(*chunk_results):
+    """
+    Mock for an agent's run_streaming: each call yields the given
+    (index, findings, metrics, error) tuples; call_args are recorded.
+    """
+    async def _gen(*args, **kwargs):
+        for result in chunk_results:
+            yield result
+    return MagicMock(side_effect=_gen)
+
+
+def _echo_rewrites(metrics: AgentMetrics):
+    """Mock RigorRewriter.run_streaming that returns its input findings as one batch."""
+    async def _gen(findings, doc):
+        yield (0, findings, metrics, None)
+    return MagicMock(side_effect=_gen)
+
+
+@pytest.fixture
+def orch_mocks(sample_briefing, sample_evidence, sample_metrics):
+    """
+    Agents injected into the orchestrator, stubbing every method run() calls.
+
+    Defaults produce no findings; tests override e.g. orch_mocks.clarity.run_streaming.
+    The assembler is the real one wrapped in a mock, so its input can be inspected.
+    """
+    agents = OrchestratorAgents(
+        briefing=MagicMock(),
+        domain=MagicMock(),
+        clarity=MagicMock(),
+        rigor_find=MagicMock(),
+        rigor_rewrite=MagicMock(),
+        adversary=MagicMock(),
+        adversary_panel=MagicMock(),
+        assembler=MagicMock(wraps=Assembler()),
+    )
+    agents.briefing.run = AsyncMock(return_value=(sample_briefing, sample_metrics))
+    agents.domain.run = AsyncMock(return_value=(sample_evidence, [sample_metrics]))
+    agents.clarity.get_chunks.return_value = [MagicMock()]
+    agents.clarity.run_streaming = _stream_of((0, [], sample_metrics, None))
+    agents.rigor_find.get_sections.return_value = [MagicMock()]
+    agents.rigor_find.run_streaming = _stream_of((0, [], sample_metrics, None))
+    agents.rigor_rewrite._group_by_section.side_effect = lambda findings, doc: [findings]
+    agents.rigor_rewrite.run_streaming = _echo_rewrites(sample_metrics)
+    agents.adversary.run = AsyncMock(return_value=([], sample_metrics))
+    agents.adversary_panel.run = AsyncMock(return_value=([], [sample_metrics]))
+    return agents
+
+
+@pytest.fixture(scope="module")
+def all_agents_enabled() -> Settings:
+    """Settings with every agent toggled on (domain/adversary default off)."""
+    return Settings(
+        enable_briefing=True,
+        enable_clarity=True,
+        enable_rigor=True,
+        enable_domain=True,
+        enable_adversary=True,
+    )
+
+
+@pytest.fixture
+def run_events(orch_mocks, all_agents_enabled, sample_doc):
+    """Run the orchestrator over sample_doc with the injected agents; return all events."""
+    async def _run(config: ReviewConfig) -> list:
+        orchestrator = Orchestrator(orch_mocks, settings=all_agents_enabled)
+        return [event async for event in orchestrator.run(sample_doc, config)]
+    return _run
+
+
 # ============================================================
 # TEST: PARALLEL BRIEFING AND DOMAIN
 # ============================================================
@@ -143,62 +259,19 @@ class TestParallelBriefingDomain:
     """Tests that Briefing and Domain run in parallel."""
 
     @pytest.mark.asyncio
-    async def test_briefing_and_domain_called(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_metrics
-    ):
+    async def test_briefing_and_domain_called(self, orch_mocks, run_events, sample_config):
         """Briefing and Domain agents are both called."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent"), \
-             patch("app.services.orchestrator.RigorFinder"), \
-             patch("app.services.orchestrator.RigorRewriter"), \
-             patch("app.services.orchestrator.AdversaryAgent"), \
-             patch("app.services.orchestrator.Assembler"):
-
-            # Setup mocks
-            mock_briefing_instance = MockBriefing.return_value
-            mock_briefing_instance.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-
-            mock_domain_instance = MockDomain.return_value
-            mock_domain_instance.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Both should be called
-            mock_briefing_instance.run.assert_called_once()
-            mock_domain_instance.run.assert_called_once()
+        await run_events(sample_config)
+
+        orch_mocks.briefing.run.assert_called_once()
+        orch_mocks.domain.run.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_domain_skipped_when_disabled(
-        self, sample_doc, sample_briefing, sample_metrics
-    ):
+    async def test_domain_skipped_when_disabled(self, orch_mocks, run_events):
         """Domain is skipped when enable_domain=False."""
-        config = ReviewConfig(enable_domain=False)
-
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent"), \
-             patch("app.services.orchestrator.RigorFinder"), \
-             patch("app.services.orchestrator.RigorRewriter"), \
-             patch("app.services.orchestrator.AdversaryAgent"), \
-             patch("app.services.orchestrator.Assembler"):
-
-            mock_briefing_instance = MockBriefing.return_value
-            mock_briefing_instance.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, config)
+        await run_events(ReviewConfig(enable_domain=False))
 
-            # Domain should NOT be called
-            mock_domain_instance = MockDomain.return_value
-            mock_domain_instance.run.assert_not_called()
+        orch_mocks.domain.run.assert_not_called()
 
 
 # ============================================================
@@ -210,66 +283,23 @@ class TestClarityRigorAfterBriefing:
 
     @pytest.mark.asyncio
     async def test_clarity_receives_briefing(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence,
-        sample_finding, sample_metrics
+        self, orch_mocks, run_events, sample_config, sample_briefing
     ):
         """Clarity agent receives briefing output."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter"), \
-             patch("app.services.orchestrator.AdversaryAgent"), \
-             patch("app.services.orchestrator.Assembler"):
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([sample_finding], [sample_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(
-                return_value=([], [sample_metrics])
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Clarity should receive briefing
-            call_args = MockClarity.return_value.run.call_args
-            assert call_args[1]["briefing"] == sample_briefing
+        await run_events(sample_config)
+
+        call_args = orch_mocks.clarity.run_streaming.call_args
+        assert call_args.kwargs["briefing"] == sample_briefing
 
     @pytest.mark.asyncio
     async def test_rigor_find_receives_briefing(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_metrics
+        self, orch_mocks, run_events, sample_config, sample_briefing
     ):
         """Rigor-Find agent receives briefing output."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter"), \
-             patch("app.services.orchestrator.AdversaryAgent"), \
-             patch("app.services.orchestrator.Assembler"):
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Rigor-Find should receive briefing
-            call_args = MockRigorFind.return_value.run.call_args
-            assert call_args[1]["briefing"] == sample_briefing
+        await run_events(sample_config)
+
+        call_args = orch_mocks.rigor_find.run_streaming.call_args
+        assert call_args.kwargs["briefing"] == sample_briefing
 
 
 # ============================================================
@@ -281,84 +311,39 @@ class TestRigorRewriteAdversaryParallel:
 
     @pytest.mark.asyncio
     async def test_rigor_rewrite_receives_findings(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence,
-        sample_finding, sample_metrics
+        self, orch_mocks, run_events, sample_config, sample_metrics
     ):
         """Rigor-Rewrite receives findings from Rigor-Find."""
-        rigor_finding = Finding(
-            id="rigor-001",
-            agent_id="rigor_find",
-            category="rigor_methodology",
-            severity="major",
-            title="Rigor issue",
-            description="Method concern",
-            anchors=[Anchor(paragraph_id="p_002", quoted_text="Methods")],
-        )
+        orch_mocks.rigor_find.run_streaming = _stream_of((0, [RIGOR_FINDING], sample_metrics, None))
+
+        await run_events(sample_config)
 
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler"):
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorFind.return_value.run = AsyncMock(
-                return_value=([rigor_finding], [sample_metrics])
-            )
-            MockRigorRewrite.return_value.run = AsyncMock(
-                return_value=([rigor_finding], [sample_metrics])
-            )
-            MockAdversary.return_value.run = AsyncMock(
-                return_value=([], sample_metrics)
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Rigor-Rewrite should receive findings
-            call_args = MockRigorRewrite.return_value.run.call_args
-            assert rigor_finding in call_args[0][0]  # First positional arg
+        call_args = orch_mocks.rigor_rewrite.run_streaming.call_args
+        assert RIGOR_FINDING in call_args.args[0]
 
     @pytest.mark.asyncio
     async def test_adversary_receives_evidence(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_metrics
+        self, orch_mocks, run_events, sample_config, sample_evidence
     ):
         """Adversary receives evidence pack from Domain."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler"):
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(
-                return_value=([], sample_metrics)
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Adversary should receive evidence
-            call_args = MockAdversary.return_value.run.call_args
-            assert call_args[1]["evidence"] == sample_evidence
+        await run_events(sample_config)
+
+        call_args = orch_mocks.adversary.run.call_args
+        assert call_args.kwargs["evidence"] == sample_evidence
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("panel_mode", [False, True])
+    async def test_adversary_selected_by_panel_mode(self, orch_mocks, run_events, panel_mode):
+        """panel_mode picks the injected panel adversary; otherwise the single one runs."""
+        events = await run_events(ReviewConfig(panel_mode=panel_mode))
+
+        chosen, other = (
+            (orch_mocks.adversary_panel, orch_mocks.adversary) if panel_mode
+            else (orch_mocks.adversary, orch_mocks.adversary_panel)
+        )
+        chosen.run.assert_called_once()
+        other.run.assert_not_called()
+        assert isinstance(events[-1], ReviewCompletedEvent)
 
 
 # ============================================================
@@ -370,175 +355,39 @@ class TestAssemblerAtEnd:
 
     @pytest.mark.asyncio
     async def test_assembler_receives_all_findings(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_metrics
+        self, orch_mocks, run_events, sample_config, sample_metrics
     ):
-        """Assembler receives findings from all agents."""
-        clarity_finding = Finding(
-            id="clarity-001",
-            agent_id="clarity",
-            category="clarity_sentence",
-            severity="minor",
-            title="Clarity issue",
-            description="Description",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text")],
-        )
-        rigor_finding = Finding(
-            id="rigor-001",
-            agent_id="rigor_rewrite",
-            category="rigor_methodology",
-            severity="major",
-            title="Rigor issue",
-            description="Description",
-            anchors=[Anchor(paragraph_id="p_002", quoted_text="text")],
+        """Assembler receives clarity, rewritten rigor and adversary findings."""
+        orch_mocks.clarity.run_streaming = _stream_of((0, [CLARITY_FINDING], sample_metrics, None))
+        orch_mocks.rigor_find.run_streaming = _stream_of((0, [RIGOR_FINDING], sample_metrics, None))
+        orch_mocks.rigor_rewrite.run_streaming = _stream_of(
+            (0, [REWRITTEN_RIGOR_FINDING], sample_metrics, None)
         )
-        adversary_finding = Finding(
-            id="adversary-001",
-            agent_id="adversary",
-            category="adversarial_weakness",
-            severity="critical",
-            title="Adversary issue",
-            description="Description",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text")],
-        )
-
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([clarity_finding], [sample_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(
-                return_value=([rigor_finding], [sample_metrics])
-            )
-            MockRigorRewrite.return_value.run = AsyncMock(
-                return_value=([rigor_finding], [sample_metrics])
-            )
-            MockAdversary.return_value.run = AsyncMock(
-                return_value=([adversary_finding], sample_metrics)
-            )
-
-            # Assembler returns sorted/deduped findings
-            MockAssembler.return_value.assemble = MagicMock(
-                return_value=[clarity_finding, rigor_finding, adversary_finding]
-            )
-
-            orchestrator = Orchestrator()
-            await orchestrator.run(sample_doc, sample_config)
-
-            # Assembler should be called with all findings
-            call_args = MockAssembler.return_value.assemble.call_args
-            findings_input = call_args[0][0]
-
-            # Should include findings from clarity, rigor, and adversary
-            assert any(f.agent_id == "clarity" for f in findings_input)
-            assert any(f.agent_id == "rigor_rewrite" for f in findings_input)
-            assert any(f.agent_id == "adversary" for f in findings_input)
+        orch_mocks.adversary.run = AsyncMock(return_value=([ADVERSARY_FINDING], sample_metrics))
 
+        await run_events(sample_config)
 
-# ============================================================
-# TEST: RETURNS REVIEW JOB
-# ============================================================
+        orch_mocks.assembler.assemble.assert_called_once()
+        findings_input = orch_mocks.assembler.assemble.call_args.args[0]
+        agent_ids = {f.agent_id for f in findings_input}
 
-class TestReturnsReviewJob:
-    """Tests that orchestrator returns ReviewJob with findings and metrics."""
-
-    @pytest.mark.asyncio
-    async def test_returns_review_job(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence,
-        sample_finding, sample_metrics
-    ):
-        """Orchestrator returns ReviewJob instance."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([sample_finding], [sample_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(return_value=([], sample_metrics))
-            MockAssembler.return_value.assemble = MagicMock(
-                return_value=[sample_finding]
-            )
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            assert isinstance(result, ReviewJob)
-            assert result.document_id == sample_doc.document_id
-            assert result.status == "completed"
-
-    @pytest.mark.asyncio
-    async def test_review_job_has_findings(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence,
-        sample_finding, sample_metrics
-    ):
-        """ReviewJob contains assembled findings."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([sample_finding], [sample_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(return_value=([], sample_metrics))
-            MockAssembler.return_value.assemble = MagicMock(
-                return_value=[sample_finding]
-            )
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            assert len(result.findings) == 1
-            assert result.findings[0].id == sample_finding.id
+        # Rewritten rigor findings replace the rigor_find originals (same id)
+        assert agent_ids == {"clarity", "rigor_rewrite", "adversary"}
 
 
 # ============================================================
-# TEST: METRICS AGGREGATION
+# TEST: FINAL EVENT CARRIES FINDINGS AND AGGREGATED METRICS
 # ============================================================
 
-class TestMetricsAggregation:
-    """Tests that metrics are properly aggregated for dev banner."""
+class TestReviewJobShape:
+    """Tests that the final ReviewCompletedEvent carries findings and metrics."""
 
     @pytest.mark.asyncio
-    async def test_metrics_aggregated(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_finding
+    async def test_review_job_shape(
+        self, orch_mocks, run_events, sample_config, sample_briefing, sample_evidence,
+        sample_finding
     ):
-        """All agent metrics are aggregated into ReviewMetrics."""
+        """ReviewCompletedEvent carries the assembled findings and dev-banner metrics."""
         briefing_metrics = AgentMetrics(
             agent_id="briefing",
             model="claude-sonnet",
@@ -564,79 +413,33 @@ class TestMetricsAggregation:
             cost_usd=0.0015,
         )
 
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, briefing_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [domain_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([sample_finding], [clarity_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], []))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(
-                return_value=([], briefing_metrics)  # reuse for simplicity
-            )
-            MockAssembler.return_value.assemble = MagicMock(
-                return_value=[sample_finding]
-            )
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            # Metrics should be aggregated
-            assert result.metrics.total_input_tokens >= 100  # At least briefing
-            assert result.metrics.total_cost_usd > 0
-            assert len(result.metrics.agent_metrics) > 0
+        orch_mocks.briefing.run = AsyncMock(return_value=(sample_briefing, briefing_metrics))
+        orch_mocks.domain.run = AsyncMock(return_value=(sample_evidence, [domain_metrics]))
+        orch_mocks.clarity.run_streaming = _stream_of((0, [sample_finding], clarity_metrics, None))
 
-    @pytest.mark.asyncio
-    async def test_dev_banner_format(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence,
-        sample_finding, sample_metrics
-    ):
-        """Metrics can be formatted for dev banner."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            MockClarity.return_value.run = AsyncMock(
-                return_value=([sample_finding], [sample_metrics])
-            )
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(return_value=([], sample_metrics))
-            MockAssembler.return_value.assemble = MagicMock(
-                return_value=[sample_finding]
-            )
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            # Should be able to format for dev banner
-            banner = result.metrics.to_dev_banner()
-            assert "total" in banner
-            assert "time_s" in banner["total"]
-            assert "cost_usd" in banner["total"]
-            assert "tokens" in banner["total"]
+        events = await run_events(sample_config)
+
+        # Stream ends with exactly one ReviewCompletedEvent
+        final = events[-1]
+        assert isinstance(final, ReviewCompletedEvent)
+        assert sum(isinstance(e, ReviewCompletedEvent) for e in events) == 1
+
+        # Findings
+        assert final.total_findings == 1
+        assert [f.id for f in final.findings] == [sample_finding.id]
+
+        # Dev-banner metrics aggregated across agents
+        assert final.metrics.keys() == {
+            "total_time_ms", "total_cost_usd", "agents_run", "agent_metrics",
+            "by_track", "by_severity",
+        }
+        assert final.metrics["total_cost_usd"] >= 0.001 + 0.002 + 0.0015
+        agent_metrics = final.metrics["agent_metrics"]
+        assert {"briefing", "domain", "clarity"} <= agent_metrics.keys()
+        assert agent_metrics["domain"]["time_ms"] == 1000
+        assert agent_metrics["clarity"]["findings_count"] == 1
+        assert final.metrics["by_track"] == {"A": 1}
+        assert final.metrics["by_severity"] == {"minor": 1}
 
 
 # ============================================================
@@ -647,55 +450,23 @@ class TestErrorHandling:
     """Tests that orchestrator handles agent failures gracefully."""
 
     @pytest.mark.asyncio
-    async def test_handles_agent_failure(
-        self, sample_doc, sample_config, sample_briefing, sample_evidence, sample_metrics
-    ):
-        """Orchestrator handles individual agent failures gracefully."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing, \
-             patch("app.services.orchestrator.DomainPipeline") as MockDomain, \
-             patch("app.services.orchestrator.ClarityAgent") as MockClarity, \
-             patch("app.services.orchestrator.RigorFinder") as MockRigorFind, \
-             patch("app.services.orchestrator.RigorRewriter") as MockRigorRewrite, \
-             patch("app.services.orchestrator.AdversaryAgent") as MockAdversary, \
-             patch("app.services.orchestrator.Assembler") as MockAssembler:
-
-            MockBriefing.return_value.run = AsyncMock(
-                return_value=(sample_briefing, sample_metrics)
-            )
-            MockDomain.return_value.run = AsyncMock(
-                return_value=(sample_evidence, [sample_metrics])
-            )
-            # Clarity fails
-            MockClarity.return_value.run = AsyncMock(
-                side_effect=Exception("LLM API Error")
-            )
-            MockRigorFind.return_value.run = AsyncMock(return_value=([], [sample_metrics]))
-            MockRigorRewrite.return_value.run = AsyncMock(return_value=([], []))
-            MockAdversary.return_value.run = AsyncMock(return_value=([], sample_metrics))
-            MockAssembler.return_value.assemble = MagicMock(return_value=[])
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            # Should still return a result (with error status or partial results)
-            assert result is not None
-            assert result.status in ["completed", "failed"]
+    async def test_handles_agent_failure(self, orch_mocks, run_events, sample_config):
+        """A failing non-critical agent does not stop the review."""
+        orch_mocks.clarity.run_streaming = MagicMock(side_effect=Exception("LLM API Error"))
+
+        events = await run_events(sample_config)
+
+        assert isinstance(events[-1], ReviewCompletedEvent)
+        orch_mocks.assembler.assemble.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_failed_job_has_error_message(
-        self, sample_doc, sample_config
-    ):
-        """Failed job includes error message."""
-        with patch("app.services.orchestrator.BriefingAgent") as MockBriefing:
-            # Briefing fails - critical failure
-            MockBriefing.return_value.run = AsyncMock(
-                side_effect=Exception("Critical failure")
-            )
-
-            orchestrator = Orchestrator()
-            result = await orchestrator.run(sample_doc, sample_config)
-
-            # Should have error info
-            assert result.status == "failed"
-            assert result.error is not None
-            assert "Critical failure" in result.error
+    async def test_failed_briefing_emits_error(self, orch_mocks, run_events, sample_config):
+        """A briefing failure is reported as a non-recoverable ErrorEvent."""
+        orch_mocks.briefing.run = AsyncMock(side_effect=Exception("Critical failure"))
+
+        events = await run_events(sample_config)
+
+        errors = [e for e in events if isinstance(e, ErrorEvent)]
+        assert len(errors) == 1
+        assert "Critical failure" in errors[0].message
+        assert errors[0].recoverable is False
@@ -10,53 +10,163 @@ Tests:
 """
 
 import pytest
+import pytest_asyncio
+import asyncio
 import json
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+import re
+from collections import deque
+from collections.abc import Iterator
+from httpx import ASGITransport, AsyncClient
 
-from app.main import app
 from app.models import (
-    ReviewJob, ReviewConfig, ReviewMetrics, AgentMetrics,
-    Finding, Anchor,
+    DocObj, ReviewJob, ReviewConfig,
     PhaseStartedEvent, AgentCompletedEvent, ReviewCompletedEvent,
 )
 
+# Every test here is async; share one event loop across the module.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.chunk(name="sse"),
+]
+
 
 # ============================================================
 # FIXTURES
 # ============================================================
 
-@pytest.fixture
-def client():
-    """FastAPI test client."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported on first use so `-k` subsets skip building it."""
+    from app.main import app as _app
+    return _app
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app) -> ASGITransport:
+    """ASGI transport bound to the app, built once per session."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def aclient(asgi_transport):
+    """Async client talking to the app in-process over the shared transport."""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
 
 
 @pytest.fixture
-def sample_events():
-    """Sample SSE events for testing."""
-    return [
-        PhaseStartedEvent(phase="briefing_domain"),
-        AgentCompletedEvent(
-            agent_id="briefing",
-            findings_count=0,
-            time_ms=500,
-            cost_usd=0.001,
-        ),
-        AgentCompletedEvent(
-            agent_id="clarity",
-            findings_count=2,
-            time_ms=1000,
-            cost_usd=0.002,
-        ),
-        ReviewCompletedEvent(
-            total_findings=2,
-            metrics={
-                "total": {"time_s": 1.5, "cost_usd": 0.003, "tokens": 500},
-                "agents": {},
-            },
-        ),
-    ]
+def run_stream(aclient, monkeypatch):
+    """Return an async helper that streams the given events and returns the response."""
+    async def _run(events):
+        review = _seed_jobs(monkeypatch, ["job-123"])
+        monkeypatch.setattr(review._orchestrator, "run", lambda doc, config: _gen_from(events))
+        return await aclient.get("/review/job-123/stream")
+    return _run
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def stream_text(run_stream, request):
+    """Stream the events given as the indirect param and return the raw SSE body."""
+    response = await run_stream(request.param)
+    return response.text
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dev_banner_bodies(asgi_transport):
+    """
+    SSE bodies for the dev-banner tests, fetched concurrently once per module.
+
+    Returns (with_metrics, without_metrics): each stream is a single
+    ReviewCompletedEvent. Each job's document_id is its job_id, so both
+    requests share one patched orchestrator run.
+    """
+    streams = {
+        "job-metrics": [
+            ReviewCompletedEvent(
+                total_findings=3,
+                metrics={
+                    "total": {"time_s": 2.5, "cost_usd": 0.005, "tokens": 1000},
+                    "agents": {"clarity": {"calls": 1, "time_ms": 1000}},
+                },
+            ),
+        ],
+        "job-empty": [ReviewCompletedEvent(total_findings=5, metrics={})],
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        review = _seed_jobs(mp, streams)
+        mp.setattr(
+            review._orchestrator, "run",
+            lambda doc, config: _gen_from(streams[doc.document_id]),
+        )
+        async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.get(f"/review/{job_id}/stream") for job_id in streams)
+            )
+    return tuple(r.text for r in responses)
+
+
+def _seed_jobs(mp: pytest.MonkeyPatch, job_ids):
+    """
+    Register a pending job per id in the route's in-memory stores.
+
+    Each job's document reuses the job id as its document_id. Entries are
+    removed when mp is undone. Returns the review routes module.
+    """
+    from app.api.routes import review
+
+    for job_id in job_ids:
+        doc = DocObj(document_id=job_id, filename="test.pdf", type="pdf")
+        mp.setitem(review._documents, job_id, doc)
+        mp.setitem(review._jobs, job_id, ReviewJob(id=job_id, document_id=job_id, config=ReviewConfig()))
+        mp.setitem(review._job_findings, job_id, [])
+    return review
+
+
+async def _gen_from(events):
+    """Async generator over a fixed event list, standing in for Orchestrator.run."""
+    for event in events:
+        yield event
+
+
+# One SSE frame: "data: <json>\n\n"
+_SSE_RE = re.compile(r"data: (.*?)\n\n", re.DOTALL)
+
+
+def _iter_events(text: str) -> Iterator[dict]:
+    """Lazily parse SSE text into event dicts, one per data frame."""
+    for m in _SSE_RE.finditer(text):
+        yield json.loads(m.group(1))
+
+
+def _last_event(text: str) -> dict:
+    """Return the final event in an SSE body."""
+    return deque(_iter_events(text), maxlen=1)[0]
+
+
+# Full pipeline-shaped stream ending in ReviewCompletedEvent
+SAMPLE_EVENTS = [
+    PhaseStartedEvent(phase="briefing_domain"),
+    AgentCompletedEvent(
+        agent_id="briefing",
+        findings_count=0,
+        time_ms=500,
+        cost_usd=0.001,
+    ),
+    AgentCompletedEvent(
+        agent_id="clarity",
+        findings_count=2,
+        time_ms=1000,
+        cost_usd=0.002,
+    ),
+    ReviewCompletedEvent(
+        total_findings=2,
+        metrics={
+            "total": {"time_s": 1.5, "cost_usd": 0.003, "tokens": 500},
+            "agents": {},
+        },
+    ),
+]
 
 
 # ============================================================
@@ -66,51 +176,31 @@ def sample_events():
 class TestSSEEndpoint:
     """Tests for GET /review/{job_id}/stream endpoint."""
 
-    def test_stream_returns_sse(self, client):
+    async def test_stream_returns_sse(self, run_stream):
         """GET /review/{job_id}/stream returns SSE content type."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield PhaseStartedEvent(phase="briefing_domain")
-                yield ReviewCompletedEvent(total_findings=0, metrics={})
-
-            mock_stream.return_value = mock_generator()
+        response = await run_stream([
+            PhaseStartedEvent(phase="briefing_domain"),
+            ReviewCompletedEvent(total_findings=0, metrics={}),
+        ])
 
-            response = client.get("/review/job-123/stream")
+        assert response.status_code == 200
+        assert "text/event-stream" in response.headers.get("content-type", "")
 
-            assert response.status_code == 200
-            assert "text/event-stream" in response.headers.get("content-type", "")
-
-    def test_events_have_correct_format(self, client):
+    async def test_events_have_correct_format(self, run_stream):
         """Events have format: data: {...}\n\n"""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield PhaseStartedEvent(phase="briefing_domain")
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
+        response = await run_stream([PhaseStartedEvent(phase="briefing_domain")])
 
-            content = response.text
-            assert content.startswith("data: ")
-            assert "\n\n" in content
+        content = response.text
+        assert content.startswith("data: ")
+        assert "\n\n" in content
 
-    def test_events_are_valid_json(self, client):
+    async def test_events_are_valid_json(self, run_stream):
         """Event data is valid JSON."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield PhaseStartedEvent(phase="briefing_domain")
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
+        response = await run_stream([PhaseStartedEvent(phase="briefing_domain")])
 
-            # Parse the SSE data
-            for line in response.text.strip().split("\n\n"):
-                if line.startswith("data: "):
-                    json_str = line[6:]  # Remove "data: " prefix
-                    data = json.loads(json_str)
-                    assert "type" in data
-                    assert data["type"] == "phase_started"
+        for data in _iter_events(response.text):
+            assert "type" in data
+            assert data["type"] == "phase_started"
 
 
 # ============================================================
@@ -120,67 +210,40 @@ class TestSSEEndpoint:
 class TestEventTypes:
     """Tests that correct event types are emitted."""
 
-    def test_phase_started_event(self, client):
+    @pytest.mark.parametrize("stream_text", [[
+        PhaseStartedEvent(phase="briefing_domain"),
+        ReviewCompletedEvent(total_findings=0, metrics={}),
+    ]], indirect=True)
+    async def test_phase_started_event(self, stream_text):
         """PhaseStartedEvent is emitted."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield PhaseStartedEvent(phase="briefing_domain")
-                yield ReviewCompletedEvent(total_findings=0, metrics={})
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
+        phase_event = next(
+            (e for e in _iter_events(stream_text) if e.get("type") == "phase_started"), None
+        )
+        assert phase_event is not None
+        assert phase_event["phase"] == "briefing_domain"
 
-            events = self._parse_events(response.text)
-            phase_events = [e for e in events if e.get("type") == "phase_started"]
-            assert len(phase_events) >= 1
-            assert phase_events[0]["phase"] == "briefing_domain"
-
-    def test_agent_completed_event(self, client):
+    @pytest.mark.parametrize("stream_text", [[
+        AgentCompletedEvent(
+            agent_id="clarity",
+            findings_count=2,
+            time_ms=1000,
+            cost_usd=0.002,
+        ),
+        ReviewCompletedEvent(total_findings=2, metrics={}),
+    ]], indirect=True)
+    async def test_agent_completed_event(self, stream_text):
         """AgentCompletedEvent is emitted."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield AgentCompletedEvent(
-                    agent_id="clarity",
-                    findings_count=2,
-                    time_ms=1000,
-                    cost_usd=0.002,
-                )
-                yield ReviewCompletedEvent(total_findings=2, metrics={})
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
-
-            events = self._parse_events(response.text)
-            agent_events = [e for e in events if e.get("type") == "agent_completed"]
-            assert len(agent_events) >= 1
-            assert agent_events[0]["agent_id"] == "clarity"
-            assert agent_events[0]["findings_count"] == 2
-
-    def test_review_completed_is_final(self, client, sample_events):
+        agent_event = next(
+            (e for e in _iter_events(stream_text) if e.get("type") == "agent_completed"), None
+        )
+        assert agent_event is not None
+        assert agent_event["agent_id"] == "clarity"
+        assert agent_event["findings_count"] == 2
+
+    @pytest.mark.parametrize("stream_text", [SAMPLE_EVENTS], indirect=True)
+    async def test_review_completed_is_final(self, stream_text):
         """ReviewCompletedEvent is the final event."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                for event in sample_events:
-                    yield event
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
-
-            events = self._parse_events(response.text)
-            assert len(events) > 0
-            assert events[-1]["type"] == "review_completed"
-
-    def _parse_events(self, text: str) -> list[dict]:
-        """Parse SSE text into list of event dicts."""
-        events = []
-        for line in text.strip().split("\n\n"):
-            if line.startswith("data: "):
-                json_str = line[6:]
-                events.append(json.loads(json_str))
-        return events
+        assert _last_event(stream_text)["type"] == "review_completed"
 
 
 # ============================================================
@@ -190,49 +253,17 @@ class TestEventTypes:
 class TestDevBannerInFinalEvent:
     """Tests that ReviewCompletedEvent includes dev banner metrics."""
 
-    def test_final_event_has_metrics(self, client):
+    async def test_final_event_has_metrics(self, dev_banner_bodies):
         """ReviewCompletedEvent includes metrics."""
-        metrics = {
-            "total": {"time_s": 2.5, "cost_usd": 0.005, "tokens": 1000},
-            "agents": {"clarity": {"calls": 1, "time_ms": 1000}},
-        }
-
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield ReviewCompletedEvent(total_findings=3, metrics=metrics)
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
+        final_event = _last_event(dev_banner_bodies[0])
 
-            events = self._parse_events(response.text)
-            final_event = events[-1]
+        assert final_event["type"] == "review_completed"
+        assert "metrics" in final_event
+        assert final_event["metrics"]["total"]["time_s"] == 2.5
+        assert final_event["metrics"]["total"]["cost_usd"] == 0.005
 
-            assert final_event["type"] == "review_completed"
-            assert "metrics" in final_event
-            assert final_event["metrics"]["total"]["time_s"] == 2.5
-            assert final_event["metrics"]["total"]["cost_usd"] == 0.005
-
-    def test_final_event_has_total_findings(self, client):
+    async def test_final_event_has_total_findings(self, dev_banner_bodies):
         """ReviewCompletedEvent includes total findings count."""
-        with patch("app.api.routes.review.stream_review_events") as mock_stream:
-            async def mock_generator():
-                yield ReviewCompletedEvent(total_findings=5, metrics={})
-
-            mock_stream.return_value = mock_generator()
-
-            response = client.get("/review/job-123/stream")
-
-            events = self._parse_events(response.text)
-            final_event = events[-1]
-
-            assert final_event["total_findings"] == 5
+        final_event = _last_event(dev_banner_bodies[1])
 
-    def _parse_events(self, text: str) -> list[dict]:
-        """Parse SSE text into list of event dicts."""
-        events = []
-        for line in text.strip().split("\n\n"):
-            if line.startswith("data: "):
-                json_str = line[6:]
-                events.append(json.loads(json_str))
-        return events
+        assert final_event["total_findings"] == 5
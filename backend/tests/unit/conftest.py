@@ -0,0 +1,106 @@
+"""
+Shared fixtures for unit tests.
+
+Document fixtures stay in their test modules: test_chunker.py and
+test_composer.py each assert on the text and layout of their own sample_doc.
+"""
+
+import pytest
+from app.models import BriefingOutput, Finding, Anchor, EvidencePack
+
+
+# ==============================================================================
+# SHARED AGENT OUTPUTS (read-only, built once per session)
+# ==============================================================================
+
+@pytest.fixture(scope="session")
+def sample_briefing() -> BriefingOutput:
+    """Sample BriefingOutput for testing."""
+    return BriefingOutput(
+        summary="A study examining the effects of treatment X.",
+        main_claims=["Treatment X improves outcomes", "Effect size is significant"],
+        stated_scope="Limited to adult population",
+        stated_limitations=["Small sample size"],
+        methodology_summary="Randomized controlled trial",
+        domain_keywords=["treatment", "RCT", "outcomes"]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_findings() -> list[Finding]:
+    """Sample findings for testing."""
+    return [
+        Finding(
+            id="finding_001",
+            agent_id="rigor_find",
+            category="rigor_logic",
+            severity="major",
+            title="Unsupported inference",
+            description="The conclusion does not follow from the evidence.",
+            anchors=[
+                Anchor(paragraph_id="p_003", quoted_text="This is the methods")
+            ]
+        )
+    ]
+
+
+@pytest.fixture(scope="session")
+def base_finding() -> Finding:
+    """Minimal valid Finding; tests derive variants with model_copy(update=...)."""
+    return Finding(
+        agent_id="clarity",
+        category="clarity_sentence",
+        severity="minor",
+        title="Test",
+        description="Desc",
+        anchors=[Anchor(paragraph_id="p_001", quoted_text="text")]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_evidence_pack() -> EvidencePack:
+    """Sample EvidencePack for testing."""
+    return EvidencePack(
+        queries_used=["RCT limitations", "treatment X efficacy"],
+        design_limitations=["RCTs cannot establish long-term effects"],
+        contradictions=["Jones 2023 found no effect"],
+        confidence="medium"
+    )
+
+
+@pytest.fixture(scope="session")
+def briefing_formatted(sample_briefing: BriefingOutput) -> str:
+    """sample_briefing as it appears inside prompts."""
+    return sample_briefing.format_for_prompt()
+
+
+@pytest.fixture(scope="session")
+def evidence_formatted(sample_evidence_pack: EvidencePack) -> str:
+    """sample_evidence_pack as it appears inside prompts."""
+    return sample_evidence_pack.format_for_prompt()
+
+
+# ==============================================================================
+# SETTINGS
+# ==============================================================================
+
+@pytest.fixture(scope="session")
+def settings():
+    """The app's cached Settings (env parsed once per session)."""
+    from app.config import get_settings
+    return get_settings()
+
+
+# ==============================================================================
+# API CLIENT
+# ==============================================================================
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app startup) per session; imported lazily so
+    model-only test modules don't pull in FastAPI."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
@@ -6,91 +6,96 @@ TDD Phase 6: Assembler
 import pytest
 from app.models import Finding, Anchor
 from app.services.assembler import Assembler
+from tests.factories import mk_finding
+
+pytestmark = pytest.mark.chunk(name="assembler")
 
 
 # ============================================================
 # FIXTURES
 # ============================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def assembler() -> Assembler:
-    """Create an Assembler instance."""
+    """Shared Assembler instance (stateless, safe to reuse across tests)."""
     return Assembler()
 
 
 @pytest.fixture
-def clarity_finding() -> Finding:
+def make_finding():
+    """
+    Factory for unvalidated test findings (see tests.factories.mk_finding).
+
+    Overrides replace the base clarity finding's fields.
+    """
+    def _make(**overrides) -> Finding:
+        fields = dict(
+            id="x",
+            agent_id="clarity",
+            category="clarity_sentence",
+            severity="minor",
+            title="t",
+            description="d",
+            anchors=[Anchor.model_construct(paragraph_id="p_001", quoted_text="t")],
+        )
+        fields.update(overrides)
+        return mk_finding(**fields)
+    return _make
+
+
+def _anchor(paragraph_id: str, quoted_text: str) -> Anchor:
+    """Unvalidated Anchor for hand-written test data."""
+    return Anchor.model_construct(paragraph_id=paragraph_id, quoted_text=quoted_text)
+
+
+@pytest.fixture
+def clarity_finding(make_finding) -> Finding:
     """Create a clarity finding."""
-    return Finding(
+    return make_finding(
         id="clarity_1",
-        agent_id="clarity",
-        category="clarity_sentence",
-        severity="minor",
         title="Unclear sentence",
         description="This sentence is confusing.",
-        anchors=[
-            Anchor(
-                paragraph_id="p_001",
-                quoted_text="The quick brown fox jumps over the lazy dog.",
-            )
-        ],
+        anchors=[_anchor("p_001", "The quick brown fox jumps over the lazy dog.")],
     )
 
 
 @pytest.fixture
-def rigor_finding() -> Finding:
+def rigor_finding(make_finding) -> Finding:
     """Create a rigor finding on same text as clarity."""
-    return Finding(
+    return make_finding(
         id="rigor_1",
         agent_id="rigor_find",
         category="rigor_logic",
         severity="major",
         title="Logic issue",
         description="The logic here is flawed.",
-        anchors=[
-            Anchor(
-                paragraph_id="p_001",
-                quoted_text="The quick brown fox jumps over the lazy dog.",
-            )
-        ],
+        anchors=[_anchor("p_001", "The quick brown fox jumps over the lazy dog.")],
     )
 
 
 @pytest.fixture
-def adversary_finding() -> Finding:
+def adversary_finding(make_finding) -> Finding:
     """Create an adversary finding on same text as others."""
-    return Finding(
+    return make_finding(
         id="adversary_1",
         agent_id="adversary",
-        category="adversarial_weakness",
+        category="overclaim",
         severity="critical",
         title="Critical weakness",
         description="This argument has a fundamental flaw.",
-        anchors=[
-            Anchor(
-                paragraph_id="p_001",
-                quoted_text="The quick brown fox jumps over the lazy dog.",
-            )
-        ],
+        anchors=[_anchor("p_001", "The quick brown fox jumps over the lazy dog.")],
     )
 
 
 @pytest.fixture
-def different_para_finding() -> Finding:
+def different_para_finding(make_finding) -> Finding:
     """Create a finding on a different paragraph."""
-    return Finding(
+    return make_finding(
         id="other_1",
-        agent_id="clarity",
         category="clarity_paragraph",
-        severity="minor",
         title="Different paragraph issue",
         description="Another issue.",
-        anchors=[
-            Anchor(
-                paragraph_id="p_002",
-                quoted_text="A completely different text.",
-            )
-        ],
+        anchors=[_anchor("p_002", "A completely different text.")],
     )
 
 
@@ -102,9 +107,10 @@ class TestEmptyInput:
     """Tests for empty input handling."""
 
     def test_empty_returns_empty(self, assembler):
-        """Empty input should return empty list."""
+        """Empty input should return no findings and a zero summary."""
         result = assembler.assemble([])
-        assert result == []
+        assert result.findings == []
+        assert result.summary.total_findings == 0
 
 
 # ============================================================
@@ -119,50 +125,43 @@ class TestNoOverlap:
         findings = [clarity_finding, different_para_finding]
         result = assembler.assemble(findings)
 
-        assert len(result) == 2
-        result_ids = {f.id for f in result}
-        assert "clarity_1" in result_ids
-        assert "other_1" in result_ids
+        assert [f.id for f in result.findings] == ["clarity_1", "other_1"]
 
 
 # ============================================================
-# TEST: Priority Dedup
+# TEST: Track-Aware Dedup
 # ============================================================
 
-class TestPriorityDedup:
-    """Tests for priority-based deduplication."""
-
-    def test_rigor_beats_clarity(self, assembler, clarity_finding, rigor_finding):
-        """Rigor (priority 2) should beat clarity (priority 3) on overlap."""
-        findings = [clarity_finding, rigor_finding]
-        result = assembler.assemble(findings)
+class TestTrackDedup:
+    """Tests for track-aware deduplication (only Track A is deduplicated)."""
 
-        assert len(result) == 1
-        assert result[0].id == "rigor_1"
-
-    def test_adversary_beats_rigor(self, assembler, rigor_finding, adversary_finding):
-        """Adversary (priority 1) should beat rigor (priority 2) on overlap."""
-        findings = [rigor_finding, adversary_finding]
-        result = assembler.assemble(findings)
+    def test_overlapping_clarity_keeps_first(self, assembler, clarity_finding, make_finding):
+        """Overlapping Track A findings collapse to one; equal priority keeps the first."""
+        duplicate = make_finding(
+            id="clarity_2",
+            title="Same sentence again",
+            description="Also confusing.",
+            anchors=[_anchor("p_001", "quick brown fox jumps")],
+        )
+        result = assembler.assemble([clarity_finding, duplicate])
 
-        assert len(result) == 1
-        assert result[0].id == "adversary_1"
+        assert [f.id for f in result.findings] == ["clarity_1"]
+        assert result.summary.total_findings == 1
 
-    def test_adversary_beats_clarity(self, assembler, clarity_finding, adversary_finding):
-        """Adversary (priority 1) should beat clarity (priority 3) on overlap."""
-        findings = [clarity_finding, adversary_finding]
-        result = assembler.assemble(findings)
+    @pytest.mark.parametrize("exempt", ["rigor_finding", "adversary_finding"])
+    def test_exempt_track_not_deduplicated(self, request, assembler, clarity_finding, exempt):
+        """Track B and C findings survive overlap with clarity."""
+        other = request.getfixturevalue(exempt)
+        result = assembler.assemble([other, clarity_finding])
 
-        assert len(result) == 1
-        assert result[0].id == "adversary_1"
+        assert [f.id for f in result.findings] == ["clarity_1", other.id]
 
-    def test_all_three_overlap(self, assembler, clarity_finding, rigor_finding, adversary_finding):
-        """When all three overlap, adversary wins."""
-        findings = [clarity_finding, rigor_finding, adversary_finding]
+    def test_all_three_overlap_all_kept(self, assembler, clarity_finding, rigor_finding, adversary_finding):
+        """One finding per track on the same text: nothing is removed."""
+        findings = [adversary_finding, rigor_finding, clarity_finding]
         result = assembler.assemble(findings)
 
-        assert len(result) == 1
-        assert result[0].id == "adversary_1"
+        assert [f.id for f in result.findings] == ["clarity_1", "rigor_1", "adversary_1"]
 
 
 # ============================================================
@@ -172,127 +171,105 @@ class TestPriorityDedup:
 class TestPresentationOrder:
     """Tests for output sorting by presentation order."""
 
-    def test_sorted_by_presentation_order(self, assembler):
+    def test_sorted_by_presentation_order(self, assembler, make_finding):
         """Output should be sorted: clarity → rigor → adversary."""
         # Create findings on different paragraphs (no overlap)
-        clarity = Finding(
+        clarity = make_finding(
             id="c1",
-            agent_id="clarity",
-            category="clarity_sentence",
-            severity="minor",
             title="Clarity issue",
             description="Desc",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text one")],
+            anchors=[_anchor("p_001", "text one")],
         )
-        rigor = Finding(
+        rigor = make_finding(
             id="r1",
             agent_id="rigor_find",
             category="rigor_logic",
             severity="major",
             title="Rigor issue",
             description="Desc",
-            anchors=[Anchor(paragraph_id="p_002", quoted_text="text two")],
+            anchors=[_anchor("p_002", "text two")],
         )
-        adversary = Finding(
+        adversary = make_finding(
             id="a1",
             agent_id="adversary",
-            category="adversarial_weakness",
+            category="overclaim",
             severity="critical",
             title="Adversary issue",
             description="Desc",
-            anchors=[Anchor(paragraph_id="p_003", quoted_text="text three")],
+            anchors=[_anchor("p_003", "text three")],
         )
-        domain = Finding(
+        domain = make_finding(
             id="d1",
             agent_id="domain",
             category="rigor_evidence",
             severity="major",
             title="Domain issue",
             description="Desc",
-            anchors=[Anchor(paragraph_id="p_004", quoted_text="text four")],
+            anchors=[_anchor("p_004", "text four")],
         )
 
         # Input in random order
         findings = [adversary, domain, clarity, rigor]
         result = assembler.assemble(findings)
 
-        assert len(result) == 4
         # clarity (1) → rigor (2) → domain (3) → adversary (4)
-        assert result[0].agent_id == "clarity"
-        assert result[1].agent_id == "rigor_find"
-        assert result[2].agent_id == "domain"
-        assert result[3].agent_id == "adversary"
+        assert [f.agent_id for f in result.findings] == [
+            "clarity", "rigor_find", "domain", "adversary",
+        ]
 
 
 # ============================================================
-# TEST: _detect_overlap
+# TEST: Reuse
 # ============================================================
 
-class TestDetectOverlap:
-    """Tests for _detect_overlap helper."""
-
-    def test_exact_match(self, assembler):
-        """Exact same text should be detected as overlap."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox")
-
-        assert assembler._detect_overlap(a1, a2) is True
-
-    def test_exact_match_case_insensitive(self, assembler):
-        """Overlap detection should be case insensitive."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The Quick Brown Fox")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="the quick brown fox")
-
-        assert assembler._detect_overlap(a1, a2) is True
-
-    def test_different_paragraphs_no_overlap(self, assembler):
-        """Different paragraphs should not overlap even with same text."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox")
-        a2 = Anchor(paragraph_id="p_002", quoted_text="The quick brown fox")
-
-        assert assembler._detect_overlap(a1, a2) is False
-
-    def test_substring_overlap(self, assembler):
-        """One text being substring of other should be overlap."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox jumps over")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="quick brown fox")
+class TestReuse:
+    """The module-scoped fixture relies on Assembler keeping no state between calls."""
 
-        assert assembler._detect_overlap(a1, a2) is True
+    def test_repeated_assemble_is_independent(self, assembler, clarity_finding, rigor_finding,
+                                              different_para_finding):
+        """A reused instance gives the same output as a fresh one, whatever ran before."""
+        first = [f.id for f in assembler.assemble([clarity_finding, rigor_finding]).findings]
+        assembler.assemble([different_para_finding])
+        again = [f.id for f in assembler.assemble([clarity_finding, rigor_finding]).findings]
+        fresh = [f.id for f in Assembler().assemble([clarity_finding, rigor_finding]).findings]
 
-    def test_substring_overlap_reverse(self, assembler):
-        """Substring detection should work in either direction."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="quick brown fox")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox jumps over")
+        assert first == again == fresh == ["clarity_1", "rigor_1"]
 
-        assert assembler._detect_overlap(a1, a2) is True
 
-    def test_partial_word_overlap(self, assembler):
-        """Contiguous word sequence should be detected as overlap."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="quick brown fox jumps")
-
-        assert assembler._detect_overlap(a1, a2) is True
-
-    def test_significant_word_overlap(self, assembler):
-        """Significant (>50%) word overlap should be detected."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="fox jumps over the lazy dog")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="the lazy dog sleeps")
-
-        # "the lazy dog" is 3 words, "the lazy dog sleeps" is 4
-        # overlap is 3/4 = 75% of smaller
-        assert assembler._detect_overlap(a1, a2) is True
-
-    def test_no_overlap_different_text(self, assembler):
-        """Completely different text should not overlap."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="A slow red cat")
-
-        assert assembler._detect_overlap(a1, a2) is False
+# ============================================================
+# TEST: _detect_overlap
+# ============================================================
 
-    def test_minimal_overlap_not_detected(self, assembler):
-        """Single common word should not count as overlap."""
-        a1 = Anchor(paragraph_id="p_001", quoted_text="The quick brown fox jumps")
-        a2 = Anchor(paragraph_id="p_001", quoted_text="The slow red cat sleeps")
+class TestDetectOverlap:
+    """Tests for _detect_overlap helper."""
 
-        # Only "The" overlaps, which is 1/5 = 20% < 50%
-        assert assembler._detect_overlap(a1, a2) is False
+    @pytest.mark.parametrize("pid1, text1, pid2, text2, expected", [
+        pytest.param("p_001", "The quick brown fox", "p_001", "The quick brown fox", True,
+                     id="exact_match"),
+        pytest.param("p_001", "The Quick Brown Fox", "p_001", "the quick brown fox", True,
+                     id="exact_match_case_insensitive"),
+        # Different paragraphs never overlap, even with the same text
+        pytest.param("p_001", "The quick brown fox", "p_002", "The quick brown fox", False,
+                     id="different_paragraphs_no_overlap"),
+        pytest.param("p_001", "The quick brown fox jumps over", "p_001", "quick brown fox", True,
+                     id="substring_overlap"),
+        pytest.param("p_001", "quick brown fox", "p_001", "The quick brown fox jumps over", True,
+                     id="substring_overlap_reverse"),
+        # Contiguous word sequence
+        pytest.param("p_001", "The quick brown fox", "p_001", "quick brown fox jumps", True,
+                     id="partial_word_overlap"),
+        # "the lazy dog" is 3/4 = 75% of the smaller text
+        pytest.param("p_001", "fox jumps over the lazy dog", "p_001", "the lazy dog sleeps", True,
+                     id="significant_word_overlap"),
+        pytest.param("p_001", "The quick brown fox", "p_001", "A slow red cat", False,
+                     id="no_overlap_different_text"),
+        # Only "The" overlaps, 1/5 = 20% < 50%
+        pytest.param("p_001", "The quick brown fox jumps", "p_001", "The slow red cat sleeps", False,
+                     id="minimal_overlap_not_detected"),
+    ])
+    def test_detect_overlap(self, assembler, pid1, text1, pid2, text2, expected):
+        """_detect_overlap flags same-paragraph anchors with overlapping text."""
+        a1 = _anchor(paragraph_id=pid1, quoted_text=text1)
+        a2 = _anchor(paragraph_id=pid2, quoted_text=text2)
+
+        assert assembler._detect_overlap(a1, a2) is expected
@@ -13,59 +13,91 @@ from app.services.chunker import (
 )
 
 
+# ~250 words; the body of every large_doc paragraph
+_LARGE_TEXT = " ".join(f"word{j}" for j in range(250))
+
+# Full text of sample_paragraphs[n - 1]: its three sentences joined
+_PARA_TEMPLATE = "Sentence 1 of paragraph {n}. Sentence 2 of paragraph {n}. Sentence 3 of paragraph {n}."
+
+
 # ============================================================
 # FIXTURES
 # ============================================================
+# Hand-written, trusted data: models are built with model_construct to skip
+# validation. Nothing in this file tests model validation.
+
+def _make_para(i: int) -> Paragraph:
+    """Paragraph i of sample_paragraphs: three short sentences, three paragraphs per section."""
+    sentences = [
+        Sentence.model_construct(
+            sentence_id=f"p_{i:03d}_s_{j:03d}",
+            paragraph_id=f"p_{i:03d}",
+            sentence_index=j,
+            text=f"Sentence {j+1} of paragraph {i+1}.",
+            start_char=j * 30,
+            end_char=(j + 1) * 30,
+        )
+        for j in range(3)
+    ]
+    return Paragraph.model_construct(
+        paragraph_id=f"p_{i:03d}",
+        section_id=f"sec_{i // 3:03d}",
+        paragraph_index=i,
+        text=_PARA_TEMPLATE.format(n=i + 1),
+        sentences=sentences,
+    )
 
-@pytest.fixture
-def sample_paragraphs() -> list[Paragraph]:
-    """Create sample paragraphs with sentences."""
-    paras = []
-    for i in range(10):
-        sentences = [
-            Sentence(
+
+def _make_large_para(i: int) -> Paragraph:
+    """Paragraph i of large_doc: _LARGE_TEXT split into two sentences, two paragraphs per section."""
+    return Paragraph.model_construct(
+        paragraph_id=f"p_{i:03d}",
+        section_id=f"sec_{i // 2:03d}",
+        paragraph_index=i,
+        text=_LARGE_TEXT,
+        sentences=[
+            Sentence.model_construct(
                 sentence_id=f"p_{i:03d}_s_{j:03d}",
                 paragraph_id=f"p_{i:03d}",
                 sentence_index=j,
-                text=f"Sentence {j+1} of paragraph {i+1}.",
-                start_char=j * 30,
-                end_char=(j + 1) * 30,
+                text=_LARGE_TEXT[j * 100:(j + 1) * 100] + ".",
+                start_char=j * 100,
+                end_char=(j + 1) * 100,
             )
-            for j in range(3)
-        ]
-        paras.append(Paragraph(
-            paragraph_id=f"p_{i:03d}",
-            section_id=f"sec_{i // 3:03d}",
-            paragraph_index=i,
-            text=" ".join(s.text for s in sentences),
-            sentences=sentences,
-        ))
-    return paras
+            for j in range(2)
+        ],
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_paragraphs() -> list[Paragraph]:
+    """Create sample paragraphs with sentences."""
+    return [_make_para(i) for i in range(10)]
+
+
+@pytest.fixture(scope="session")
 def sample_sections() -> list[Section]:
     """Create sections that group paragraphs."""
     return [
-        Section(
+        Section.model_construct(
             section_id="sec_000",
             section_index=0,
             section_title="Introduction",
             paragraph_ids=["p_000", "p_001", "p_002"],
         ),
-        Section(
+        Section.model_construct(
             section_id="sec_001",
             section_index=1,
             section_title="Methods",
             paragraph_ids=["p_003", "p_004", "p_005"],
         ),
-        Section(
+        Section.model_construct(
             section_id="sec_002",
             section_index=2,
             section_title="Results",
             paragraph_ids=["p_006", "p_007", "p_008"],
         ),
-        Section(
+        Section.model_construct(
             section_id="sec_003",
             section_index=3,
             section_title="Discussion",
@@ -74,10 +106,10 @@ def sample_sections() -> list[Section]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_doc(sample_paragraphs, sample_sections) -> DocObj:
     """Create a sample document."""
-    return DocObj(
+    return DocObj.model_construct(
         filename="test.pdf",
         type="pdf",
         title="Test Document",
@@ -86,53 +118,23 @@ def sample_doc(sample_paragraphs, sample_sections) -> DocObj:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_doc() -> DocObj:
     """Create a document with many words per paragraph for chunking tests."""
-    paras = []
-    for i in range(6):
-        # ~250 words per paragraph
-        text = " ".join([f"word{j}" for j in range(250)])
-        sentences = [
-            Sentence(
-                sentence_id=f"p_{i:03d}_s_000",
-                paragraph_id=f"p_{i:03d}",
-                sentence_index=0,
-                text=text[:100] + ".",
-                start_char=0,
-                end_char=100,
-            ),
-            Sentence(
-                sentence_id=f"p_{i:03d}_s_001",
-                paragraph_id=f"p_{i:03d}",
-                sentence_index=1,
-                text=text[100:200] + ".",
-                start_char=100,
-                end_char=200,
-            ),
-        ]
-        paras.append(Paragraph(
-            paragraph_id=f"p_{i:03d}",
-            section_id=f"sec_{i // 2:03d}",
-            paragraph_index=i,
-            text=text,
-            sentences=sentences,
-        ))
-
     sections = [
-        Section(
+        Section.model_construct(
             section_id="sec_000",
             section_index=0,
             section_title="Section A",
             paragraph_ids=["p_000", "p_001"],
         ),
-        Section(
+        Section.model_construct(
             section_id="sec_001",
             section_index=1,
             section_title="Section B",
             paragraph_ids=["p_002", "p_003"],
         ),
-        Section(
+        Section.model_construct(
             section_id="sec_002",
             section_index=2,
             section_title="Section C",
@@ -140,15 +142,27 @@ def large_doc() -> DocObj:
         ),
     ]
 
-    return DocObj(
+    return DocObj.model_construct(
         filename="large.pdf",
         type="pdf",
         title="Large Document",
-        paragraphs=paras,
+        paragraphs=[_make_large_para(i) for i in range(6)],
         sections=sections,
     )
 
 
+@pytest.fixture(scope="module")
+def clarity_chunks(large_doc) -> list[ClarityChunk]:
+    """large_doc chunked for clarity once per module (read-only)."""
+    return chunk_for_clarity(large_doc, target_words=500)
+
+
+@pytest.fixture(scope="module")
+def rigor_chunks(sample_doc) -> list[RigorChunk]:
+    """sample_doc chunked for rigor once per module (read-only)."""
+    return chunk_for_rigor(sample_doc)
+
+
 # ============================================================
 # TEST: get_last_n_sentences
 # ============================================================
@@ -229,100 +243,71 @@ class TestGetFirstNSentences:
 # TEST: chunk_for_clarity
 # ============================================================
 
+def _has_middle_context(cs) -> bool:
+    """Middle chunk (when there is one) carries context on at least one side."""
+    return len(cs) < 3 or cs[1].context_before is not None or cs[1].context_after is not None
+
+
+# (chunks, doc) -> bool; one invariant of chunk_for_clarity(large_doc, target_words=500)
+CLARITY_INVARIANTS = [
+    pytest.param(lambda cs, doc: len(cs) > 0 and all(isinstance(c, ClarityChunk) for c in cs),
+                 id="creates_chunks"),
+    pytest.param(lambda cs, doc: all(c.chunk_index == i for i, c in enumerate(cs)),
+                 id="chunks_have_correct_indices"),
+    pytest.param(lambda cs, doc: all(c.chunk_total == len(cs) for c in cs),
+                 id="chunks_have_correct_total"),
+    pytest.param(lambda cs, doc: _has_middle_context(cs),
+                 id="context_overlap_exists"),
+    pytest.param(lambda cs, doc: cs[0].context_before is None,
+                 id="first_chunk_has_no_context_before"),
+    pytest.param(lambda cs, doc: cs[-1].context_after is None,
+                 id="last_chunk_has_no_context_after"),
+    pytest.param(lambda cs, doc: sorted(pid for c in cs for pid in c.paragraph_ids)
+                 == sorted(p.paragraph_id for p in doc.paragraphs),
+                 id="all_paragraphs_included"),
+    pytest.param(lambda cs, doc: all(c.word_count == sum(len(p.text.split()) for p in c.paragraphs)
+                                     for c in cs),
+                 id="word_count_matches_paragraphs"),
+]
+
+
 class TestChunkForClarity:
     """Tests for chunk_for_clarity function."""
 
-    def test_creates_chunks(self, large_doc):
-        """Should create ClarityChunk objects."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        assert len(chunks) > 0
-        assert all(isinstance(c, ClarityChunk) for c in chunks)
-
-    def test_chunks_have_correct_indices(self, large_doc):
-        """Chunks should have sequential indices starting at 0."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        for i, chunk in enumerate(chunks):
-            assert chunk.chunk_index == i
-
-    def test_chunks_have_correct_total(self, large_doc):
-        """All chunks should have the same chunk_total."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        total = len(chunks)
-        for chunk in chunks:
-            assert chunk.chunk_total == total
-
-    def test_context_overlap_exists(self, large_doc):
-        """Middle chunks should have context_before and context_after."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        if len(chunks) >= 3:
-            middle = chunks[1]
-            assert middle.context_before is not None or middle.context_after is not None
-
-    def test_first_chunk_has_no_context_before(self, large_doc):
-        """First chunk should not have context_before."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        assert chunks[0].context_before is None
-
-    def test_last_chunk_has_no_context_after(self, large_doc):
-        """Last chunk should not have context_after."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        assert chunks[-1].context_after is None
-
-    def test_all_paragraphs_included(self, large_doc):
-        """All document paragraphs should be in exactly one chunk."""
-        chunks = chunk_for_clarity(large_doc, target_words=500)
-        all_para_ids = []
-        for chunk in chunks:
-            all_para_ids.extend(chunk.paragraph_ids)
-
-        doc_para_ids = [p.paragraph_id for p in large_doc.paragraphs]
-        assert sorted(all_para_ids) == sorted(doc_para_ids)
+    @pytest.mark.parametrize("invariant", CLARITY_INVARIANTS)
+    def test_invariant(self, clarity_chunks, large_doc, invariant):
+        """Each invariant holds for the cached clarity chunks of large_doc."""
+        assert invariant(clarity_chunks, large_doc)
 
 
 # ============================================================
 # TEST: chunk_for_rigor
 # ============================================================
 
+# (chunks, doc) -> bool; one invariant of chunk_for_rigor(sample_doc)
+RIGOR_INVARIANTS = [
+    pytest.param(lambda cs, doc: len(cs) == 4,  # sample_doc has 4 sections
+                 id="creates_one_chunk_per_section"),
+    pytest.param(lambda cs, doc: all(isinstance(c, RigorChunk) for c in cs),
+                 id="creates_rigor_chunks"),
+    pytest.param(lambda cs, doc: all(c.section is not None and c.section.section_id is not None
+                                     for c in cs),
+                 id="chunks_have_section_reference"),
+    pytest.param(lambda cs, doc: all(c.chunk_index == i for i, c in enumerate(cs)),
+                 id="chunks_have_correct_indices"),
+    pytest.param(lambda cs, doc: all(c.chunk_total == len(cs) for c in cs),
+                 id="chunks_have_correct_total"),
+    # Middle sections get context from both adjacent sections
+    pytest.param(lambda cs, doc: len(cs) < 3 or (cs[1].context_before is not None
+                                                 and cs[1].context_after is not None),
+                 id="context_overlap_between_sections"),
+]
+
+
 class TestChunkForRigor:
     """Tests for chunk_for_rigor function."""
 
-    def test_creates_one_chunk_per_section(self, sample_doc):
-        """Should create one RigorChunk per section."""
-        chunks = chunk_for_rigor(sample_doc)
-        # sample_doc has 4 sections
-        assert len(chunks) == 4
-
-    def test_creates_rigor_chunks(self, sample_doc):
-        """Should create RigorChunk objects."""
-        chunks = chunk_for_rigor(sample_doc)
-        assert all(isinstance(c, RigorChunk) for c in chunks)
-
-    def test_chunks_have_section_reference(self, sample_doc):
-        """Each chunk should reference its section."""
-        chunks = chunk_for_rigor(sample_doc)
-        for chunk in chunks:
-            assert chunk.section is not None
-            assert chunk.section.section_id is not None
-
-    def test_chunks_have_correct_indices(self, sample_doc):
-        """Chunks should have sequential indices."""
-        chunks = chunk_for_rigor(sample_doc)
-        for i, chunk in enumerate(chunks):
-            assert chunk.chunk_index == i
-
-    def test_chunks_have_correct_total(self, sample_doc):
-        """All chunks should have correct chunk_total."""
-        chunks = chunk_for_rigor(sample_doc)
-        total = len(chunks)
-        for chunk in chunks:
-            assert chunk.chunk_total == total
-
-    def test_context_overlap_between_sections(self, sample_doc):
-        """Middle sections should have context overlap from adjacent sections."""
-        chunks = chunk_for_rigor(sample_doc)
-        if len(chunks) >= 3:
-            middle = chunks[1]
-            # Should have context from previous section
-            assert middle.context_before is not None
-            # Should have context from next section
-            assert middle.context_after is not None
+    @pytest.mark.parametrize("invariant", RIGOR_INVARIANTS)
+    def test_invariant(self, rigor_chunks, sample_doc, invariant):
+        """Each invariant holds for the cached rigor chunks of sample_doc."""
+        assert invariant(rigor_chunks, sample_doc)
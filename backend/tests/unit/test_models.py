@@ -12,76 +12,87 @@ Tests for:
 
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
+
+from app.models import (
+    DocObj, Paragraph, Finding, Anchor, ProposedEdit,
+    BriefingOutput, EvidencePack, ReviewMetrics, AgentMetrics, ReviewConfig,
+    PhaseStartedEvent, FindingDiscoveredEvent,
+    ReviewOutput, ReviewSummary, ReviewMetadataOutput,
+)
+
+
+@pytest.fixture(scope="module")
+def two_paragraph_doc() -> DocObj:
+    """Small DocObj shared by the read-only DocObj tests."""
+    return DocObj(
+        filename="test.pdf",
+        type="pdf",
+        title="Test Document",
+        paragraphs=[
+            Paragraph(paragraph_id="p_001", paragraph_index=0, text="The quick brown fox."),
+            Paragraph(paragraph_id="p_002", paragraph_index=1, text="Second."),
+        ]
+    )
 
 
 class TestDocObj:
     """Tests for DocObj model."""
 
-    def test_create_docobj(self):
+    def test_create_docobj(self, two_paragraph_doc):
         """DocObj should be creatable with required fields."""
-        from app.models import DocObj
-        doc = DocObj(
-            filename="test.pdf",
-            type="pdf",
-            title="Test Document"
-        )
-        assert doc.filename == "test.pdf"
-        assert doc.type == "pdf"
-        assert doc.title == "Test Document"
-        assert doc.document_id is not None
+        assert two_paragraph_doc.filename == "test.pdf"
+        assert two_paragraph_doc.type == "pdf"
+        assert two_paragraph_doc.title == "Test Document"
+        assert two_paragraph_doc.document_id is not None
 
-    def test_docobj_get_paragraph(self):
+    def test_docobj_get_paragraph(self, two_paragraph_doc):
         """DocObj.get_paragraph should return paragraph by ID."""
-        from app.models import DocObj, Paragraph
-        doc = DocObj(
-            filename="test.pdf",
-            type="pdf",
-            title="Test",
-            paragraphs=[
-                Paragraph(paragraph_id="p_001", paragraph_index=0, text="First paragraph."),
-                Paragraph(paragraph_id="p_002", paragraph_index=1, text="Second paragraph."),
-            ]
-        )
-        p = doc.get_paragraph("p_001")
-        assert p is not None
-        assert p.text == "First paragraph."
-
-        missing = doc.get_paragraph("p_999")
-        assert missing is None
-
-    def test_docobj_get_full_text(self):
-        """DocObj.get_full_text should concatenate all paragraphs."""
-        from app.models import DocObj, Paragraph
-        doc = DocObj(
-            filename="test.pdf",
-            type="pdf",
-            title="Test",
-            paragraphs=[
-                Paragraph(paragraph_id="p_001", paragraph_index=0, text="First."),
-                Paragraph(paragraph_id="p_002", paragraph_index=1, text="Second."),
-            ]
-        )
-        full_text = doc.get_full_text()
-        assert full_text == "First.\n\nSecond."
-
-    def test_docobj_get_text_with_ids(self):
-        """DocObj.get_text_with_ids should include paragraph IDs."""
-        from app.models import DocObj, Paragraph
+        assert two_paragraph_doc.get_paragraph("p_002") is two_paragraph_doc.paragraphs[1]
+
+    @pytest.mark.parametrize("method, args, expected", [
+        ("get_paragraph", ("p_999",), None),
+        ("get_paragraph_text", ("p_001",), "The quick brown fox."),
+        ("get_paragraph_text", ("p_999",), None),
+        ("get_full_text", (), "The quick brown fox.\n\nSecond."),
+        ("get_text_with_ids", (), "[p_001] The quick brown fox.\n\n[p_002] Second."),
+        ("validate_anchor_text", ("p_001", "quick brown"), True),
+        ("validate_anchor_text", ("p_001", "slow red"), False),
+        ("validate_anchor_text", ("p_999", "anything"), False),
+    ])
+    def test_docobj_methods(self, two_paragraph_doc, method, args, expected):
+        """DocObj lookup and text helpers."""
+        assert getattr(two_paragraph_doc, method)(*args) == expected
+
+    def test_docobj_validate_anchor_texts(self, two_paragraph_doc):
+        """Batch anchor validation matches validate_anchor_text per anchor."""
+        anchors = [
+            Anchor(paragraph_id="p_001", quoted_text="quick brown"),
+            Anchor(paragraph_id="p_002", quoted_text="quick brown"),
+            Anchor(paragraph_id="p_999", quoted_text="anything"),
+            Anchor(paragraph_id="p_002", quoted_text="Second"),
+        ]
+        assert two_paragraph_doc.validate_anchor_texts(anchors) == [True, False, False, True]
+        assert two_paragraph_doc.validate_anchor_texts(anchors) == [
+            two_paragraph_doc.validate_anchor_text(a.paragraph_id, a.quoted_text) for a in anchors
+        ]
+
+    def test_docobj_duplicate_ids_resolve_to_first(self):
+        """All lookups agree on the first paragraph when IDs repeat."""
         doc = DocObj(
             filename="test.pdf",
             type="pdf",
-            title="Test",
             paragraphs=[
                 Paragraph(paragraph_id="p_001", paragraph_index=0, text="First."),
+                Paragraph(paragraph_id="p_001", paragraph_index=1, text="Duplicate."),
             ]
         )
-        text_with_ids = doc.get_text_with_ids()
-        assert "[p_001]" in text_with_ids
-        assert "First." in text_with_ids
+        assert doc.get_paragraph("p_001").text == "First."
+        assert doc.get_paragraph_text("p_001") == "First."
+        assert doc.validate_anchor_text("p_001", "First") is True
 
-    def test_docobj_validate_anchor_text(self):
-        """DocObj.validate_anchor_text should check if text exists."""
-        from app.models import DocObj, Paragraph
+    def test_docobj_lookup_cache_not_stale_after_copy(self):
+        """A model_copy variant rebuilds its paragraph lookup."""
         doc = DocObj(
             filename="test.pdf",
             type="pdf",
@@ -91,39 +102,27 @@ class TestDocObj:
             ]
         )
         assert doc.validate_anchor_text("p_001", "quick brown") is True
-        assert doc.validate_anchor_text("p_001", "slow red") is False
-        assert doc.validate_anchor_text("p_999", "anything") is False
+        assert doc.get_paragraph("p_001").text == "The quick brown fox."
+        variant = doc.model_copy(update={"paragraphs": [
+            Paragraph(paragraph_id="p_001", paragraph_index=0, text="A slow red fox."),
+        ]})
+        assert variant.validate_anchor_text("p_001", "quick brown") is False
+        assert variant.validate_anchor_text("p_001", "slow red") is True
+        assert variant.get_paragraph("p_001").text == "A slow red fox."
 
 
 class TestFinding:
     """Tests for Finding model with camelCase serialization."""
 
-    def test_finding_creation(self):
+    def test_finding_creation(self, base_finding):
         """Finding should be creatable with required fields."""
-        from app.models import Finding, Anchor
-        finding = Finding(
-            agent_id="clarity",
-            category="clarity_sentence",
-            severity="minor",
-            title="Test Finding",
-            description="A test description",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="test text")]
-        )
-        assert finding.agent_id == "clarity"
-        assert finding.id is not None
+        assert base_finding.agent_id == "clarity"
+        assert base_finding.track == "A"
+        assert base_finding.id is not None
 
-    def test_finding_camelcase_serialization(self):
+    def test_finding_camelcase_serialization(self, base_finding):
         """Finding.model_dump() should output camelCase keys."""
-        from app.models import Finding, Anchor
-        finding = Finding(
-            agent_id="clarity",
-            category="clarity_sentence",
-            severity="minor",
-            title="Test",
-            description="Desc",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text")]
-        )
-        data = finding.model_dump()
+        data = base_finding.model_dump()
         # Should have camelCase keys
         assert "agentId" in data
         assert "createdAt" in data
@@ -131,10 +130,21 @@ class TestFinding:
         assert "agent_id" not in data
         assert "created_at" not in data
 
+    def test_review_output_serializes_findings_like_model_dump(self, base_finding):
+        """ReviewOutput's batched findings dump matches per-finding model_dump()."""
+        findings = [base_finding, base_finding.model_copy(update={"id": "finding_002"})]
+        output = ReviewOutput(
+            findings=findings,
+            summary=ReviewSummary.from_findings(findings),
+            metadata=ReviewMetadataOutput(),
+        )
+        data = output.model_dump()
+        assert data["findings"] == [f.model_dump() for f in findings]
+        assert data["summary"]["totalFindings"] == 2
+
     def test_finding_requires_anchor(self):
         """Finding must have at least one anchor."""
-        from app.models import Finding
-        with pytest.raises(Exception):  # ValidationError
+        with pytest.raises(ValidationError):
             Finding(
                 agent_id="clarity",
                 category="clarity_sentence",
@@ -144,70 +154,74 @@ class TestFinding:
                 anchors=[]  # Empty - should fail
             )
 
-    def test_finding_proposed_edit_serialization(self):
+    def test_finding_proposed_edit_serialization(self, base_finding):
         """Finding with proposed_edit should serialize correctly."""
-        from app.models import Finding, Anchor, ProposedEdit
-        finding = Finding(
-            agent_id="rigor_rewrite",
-            category="rigor_methodology",
-            severity="major",
-            title="Test",
-            description="Desc",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="original")],
-            proposed_edit=ProposedEdit(
+        finding = base_finding.model_copy(update={
+            "proposed_edit": ProposedEdit(
                 type="replace",
-                anchor=Anchor(paragraph_id="p_001", quoted_text="original"),
+                anchor=Anchor(paragraph_id="p_001", quoted_text="text"),
                 new_text="improved",
                 rationale="Better wording"
             )
-        )
+        })
         data = finding.model_dump()
         assert "proposedEdit" in data
         assert data["proposedEdit"]["newText"] == "improved"
 
-    def test_finding_votes_field(self):
-        """Finding votes should be 1-3 when set."""
-        from app.models import Finding, Anchor
-        finding = Finding(
-            agent_id="adversary_panel",
-            category="adversarial_weakness",
-            severity="critical",
-            title="Test",
-            description="Desc",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text")],
-            votes=3
+    def test_proposed_edit_is_frozen(self):
+        """ProposedEdit is immutable; downgrades go through model_copy."""
+        edit = ProposedEdit(
+            type="replace",
+            anchor=Anchor(paragraph_id="p_001", quoted_text="original"),
+            rationale="Better wording"
         )
-        data = finding.model_dump()
-        assert data["votes"] == 3
+        with pytest.raises(ValidationError):
+            edit.type = "suggestion"
+        assert edit.model_copy(update={"type": "suggestion"}).type == "suggestion"
+
+    @pytest.mark.parametrize("update, key, expected", [
+        ({"votes": 3}, "votes", 3),
+        ({"metadata": {"source": "panel"}}, "metadata", {"source": "panel"}),
+    ])
+    def test_finding_optional_fields(self, base_finding, update, key, expected):
+        """votes/metadata are serialized only when set."""
+        assert key not in base_finding.model_dump()
+        assert base_finding.model_copy(update=update).model_dump()[key] == expected
+
+    def test_finding_votes_out_of_range(self, base_finding):
+        """Finding votes must be 1-3 when set."""
+        with pytest.raises(ValidationError):
+            Finding.model_validate({**dict(base_finding), "votes": 4})
 
 
 class TestAnchor:
     """Tests for Anchor model."""
 
-    def test_anchor_requires_quoted_text(self):
+    @pytest.mark.parametrize("quoted_text", ["", "   ", "\n\t"])
+    def test_anchor_requires_quoted_text(self, quoted_text):
         """Anchor must have non-empty quoted_text."""
-        from app.models import Anchor
-        with pytest.raises(Exception):  # ValidationError
-            Anchor(paragraph_id="p_001", quoted_text="")
-
-        with pytest.raises(Exception):  # ValidationError
-            Anchor(paragraph_id="p_001", quoted_text="   ")
+        with pytest.raises(ValidationError):
+            Anchor(paragraph_id="p_001", quoted_text=quoted_text)
 
     def test_anchor_valid(self):
         """Anchor with valid quoted_text should work."""
-        from app.models import Anchor
         anchor = Anchor(paragraph_id="p_001", quoted_text="valid text")
         assert anchor.paragraph_id == "p_001"
         assert anchor.quoted_text == "valid text"
 
+    def test_anchor_is_frozen(self):
+        """Anchor is immutable once built."""
+        anchor = Anchor(paragraph_id="p_001", quoted_text="valid text")
+        with pytest.raises(ValidationError):
+            anchor.quoted_text = "changed"
+
 
 class TestBriefingOutput:
     """Tests for BriefingOutput model."""
 
     def test_briefing_requires_claims(self):
         """BriefingOutput must have at least one main_claim."""
-        from app.models import BriefingOutput
-        with pytest.raises(Exception):  # ValidationError
+        with pytest.raises(ValidationError):
             BriefingOutput(
                 summary="Test summary",
                 main_claims=[]  # Empty - should fail
@@ -215,7 +229,6 @@ class TestBriefingOutput:
 
     def test_briefing_valid(self):
         """BriefingOutput with valid fields should work."""
-        from app.models import BriefingOutput
         briefing = BriefingOutput(
             summary="A test summary",
             main_claims=["Claim 1", "Claim 2"]
@@ -225,7 +238,6 @@ class TestBriefingOutput:
 
     def test_briefing_format_for_prompt(self):
         """BriefingOutput.format_for_prompt should include key info."""
-        from app.models import BriefingOutput
         briefing = BriefingOutput(
             summary="Summary text",
             main_claims=["Claim A"],
@@ -236,20 +248,25 @@ class TestBriefingOutput:
         assert "Claim A" in prompt
         assert "Stated scope: Scope text" in prompt
 
+    def test_briefing_format_for_prompt_not_stale_after_copy(self, sample_briefing):
+        """A model_copy variant renders its own prompt, not the source's cached one."""
+        assert "Treatment X" in sample_briefing.format_for_prompt()
+        variant = sample_briefing.model_copy(update={"main_claims": ["Claim B"]})
+        assert "Main claims: Claim B" in variant.format_for_prompt()
+        assert "Claim B" not in sample_briefing.format_for_prompt()
+
 
 class TestEvidencePack:
     """Tests for EvidencePack model."""
 
     def test_evidence_pack_empty(self):
         """EvidencePack.empty() should create empty pack."""
-        from app.models import EvidencePack
         pack = EvidencePack.empty()
         assert pack.confidence == "low"
         assert pack.has_content() is False
 
     def test_evidence_pack_has_content_with_data(self):
         """EvidencePack.has_content() should return True with data."""
-        from app.models import EvidencePack
         pack = EvidencePack(
             design_limitations=["Cannot establish causation"]
         )
@@ -257,7 +274,6 @@ class TestEvidencePack:
 
     def test_evidence_pack_has_content_with_gaps(self):
         """EvidencePack.has_content() should return True with gaps."""
-        from app.models import EvidencePack
         pack = EvidencePack(
             gaps="No evidence found for X"
         )
@@ -265,7 +281,6 @@ class TestEvidencePack:
 
     def test_evidence_pack_format_for_prompt(self):
         """EvidencePack.format_for_prompt should format nicely."""
-        from app.models import EvidencePack
         pack = EvidencePack(
             design_limitations=["This is observational"],
             contradictions=["Jones 2023 found opposite"]
@@ -276,13 +291,26 @@ class TestEvidencePack:
         assert "CONTRADICTIONS" in formatted
         assert "Jones 2023" in formatted
 
+    def test_evidence_pack_is_frozen(self):
+        """EvidencePack is immutable; variants are derived with model_copy."""
+        pack = EvidencePack(gaps="No evidence found for X")
+        with pytest.raises(ValidationError):
+            pack.gaps = None
+        assert pack.model_copy(update={"gaps": None}).gaps is None
+
+    def test_evidence_pack_format_for_prompt_not_stale_after_copy(self):
+        """A model_copy variant re-renders instead of reusing the cached prompt."""
+        pack = EvidencePack(gaps="No evidence found for X")
+        assert pack.format_for_prompt() is pack.format_for_prompt()
+        variant = pack.model_copy(update={"gaps": "Nothing on Y"})
+        assert "Nothing on Y" in variant.format_for_prompt()
+
 
 class TestReviewMetrics:
     """Tests for ReviewMetrics aggregation."""
 
     def test_review_metrics_add(self):
         """ReviewMetrics.add() should aggregate metrics."""
-        from app.models import ReviewMetrics, AgentMetrics
         metrics = ReviewMetrics()
 
         m1 = AgentMetrics(
@@ -313,7 +341,6 @@ class TestReviewMetrics:
 
     def test_review_metrics_by_agent(self):
         """ReviewMetrics.by_agent() should group by agent_id."""
-        from app.models import ReviewMetrics, AgentMetrics
         metrics = ReviewMetrics()
 
         metrics.add(AgentMetrics(
@@ -330,9 +357,39 @@ class TestReviewMetrics:
         assert by_agent["clarity"]["calls"] == 2
         assert by_agent["clarity"]["input_tokens"] == 2000
 
+    def test_review_metrics_by_agent_kept_current_by_add(self):
+        """by_agent() tracks add() and hands out copies, not internal state."""
+        metrics = ReviewMetrics()
+
+        metrics.add(AgentMetrics(
+            agent_id="clarity", model="claude-sonnet-4",
+            input_tokens=1000, output_tokens=500, time_ms=2000, cost_usd=0.01
+        ))
+
+        banner = metrics.to_dev_banner()
+        banner["agents"]["clarity"]["calls"] = 99
+        assert metrics.by_agent()["clarity"]["calls"] == 1
+
+        metrics.add(AgentMetrics(
+            agent_id="rigor_find", model="claude-sonnet-4",
+            input_tokens=1000, output_tokens=500, time_ms=2000, cost_usd=0.01
+        ))
+
+        refreshed = metrics.by_agent()
+        assert "rigor_find" in refreshed
+        assert refreshed["clarity"]["calls"] == 1
+
+    def test_review_metrics_by_agent_seeded_from_constructor(self):
+        """Metrics passed at construction are included in by_agent()."""
+        m = AgentMetrics(
+            agent_id="clarity", model="claude-sonnet-4",
+            input_tokens=1000, output_tokens=500, time_ms=2000, cost_usd=0.01
+        )
+        metrics = ReviewMetrics(agent_metrics=[m, m])
+        assert metrics.by_agent()["clarity"]["calls"] == 2
+
     def test_review_metrics_to_dev_banner(self):
         """ReviewMetrics.to_dev_banner() should format for frontend."""
-        from app.models import ReviewMetrics, AgentMetrics
         metrics = ReviewMetrics()
 
         metrics.add(AgentMetrics(
@@ -353,7 +410,6 @@ class TestReviewConfig:
 
     def test_review_config_defaults(self):
         """ReviewConfig should have sensible defaults."""
-        from app.models import ReviewConfig
         config = ReviewConfig()
         assert config.panel_mode is False
         assert config.enable_domain is True
@@ -365,25 +421,35 @@ class TestSSEEvents:
 
     def test_phase_started_event(self):
         """PhaseStartedEvent should serialize correctly."""
-        from app.models import PhaseStartedEvent
         event = PhaseStartedEvent(phase="briefing")
         assert event.type == "phase_started"
         assert event.phase == "briefing"
 
         sse = event.to_sse()
-        assert "data:" in sse
-        assert "phase_started" in sse
+        assert sse.startswith(b"data: ")
+        assert sse.endswith(b"\n\n")
+        assert b"phase_started" in sse
+        assert sse == f"data: {event.model_dump_json()}\n\n".encode()
 
-    def test_finding_discovered_event(self):
+    def test_finding_discovered_event(self, base_finding):
         """FindingDiscoveredEvent should include Finding."""
-        from app.models import FindingDiscoveredEvent, Finding, Anchor
-        finding = Finding(
-            agent_id="clarity",
-            category="clarity_sentence",
-            severity="minor",
-            title="Test",
-            description="Desc",
-            anchors=[Anchor(paragraph_id="p_001", quoted_text="text")]
-        )
-        event = FindingDiscoveredEvent(finding=finding)
+        event = FindingDiscoveredEvent(finding=base_finding)
         assert event.type == "finding_discovered"
+        assert event.finding is base_finding
+
+
+class TestSchemaBuild:
+    """Model schemas are compiled at import, not lazily on first use."""
+
+    def test_all_models_complete_at_import(self):
+        """No exported model is left with a deferred (incomplete) schema."""
+        import app.models
+        from pydantic import BaseModel
+
+        incomplete = [
+            name for name in app.models.__all__
+            if isinstance(obj := getattr(app.models, name), type)
+            and issubclass(obj, BaseModel)
+            and not obj.__pydantic_complete__
+        ]
+        assert incomplete == []
@@ -8,7 +8,9 @@ Tests for:
 """
 
 import pytest
-from fastapi.testclient import TestClient
+
+from app.main import app
+from app.config.settings import Settings
 
 
 class TestFastAPIApp:
@@ -16,22 +18,18 @@ class TestFastAPIApp:
 
     def test_app_exists(self):
         """FastAPI app should be importable."""
-        from app.main import app
         assert app is not None
 
     def test_app_title(self):
         """App should have correct title."""
-        from app.main import app
         assert app.title == "ZORRO API"
 
 
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_returns_ok(self):
+    def test_health_returns_ok(self, client):
         """GET /health should return {"status": "ok"}."""
-        from app.main import app
-        client = TestClient(app)
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
@@ -40,23 +38,17 @@ class TestHealthEndpoint:
 class TestSettings:
     """Tests for configuration settings."""
 
-    def test_settings_loads(self):
+    def test_settings_loads(self, settings):
         """Settings should be importable and instantiable."""
-        from app.config.settings import Settings
-        settings = Settings()
-        assert settings is not None
+        assert isinstance(settings, Settings)
 
-    def test_settings_has_required_fields(self):
+    def test_settings_has_required_fields(self, settings):
         """Settings should have required API key fields."""
-        from app.config.settings import Settings
-        settings = Settings()
         # These should exist (may be empty in test env)
         assert hasattr(settings, "anthropic_api_key")
         assert hasattr(settings, "perplexity_api_key")
 
-    def test_settings_has_app_config(self):
+    def test_settings_has_app_config(self, settings):
         """Settings should have app configuration."""
-        from app.config.settings import Settings
-        settings = Settings()
         assert hasattr(settings, "debug")
         assert hasattr(settings, "log_level")